@@ -15,221 +15,83 @@ import sys
 import json
 import re
 import time
+import gzip
+import codecs
+import logging
+import hashlib
 from pathlib import Path
 from urllib.parse import urljoin, quote
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:
     print("Error: Required packages not installed.")
     print("Install with: pip install requests beautifulsoup4")
     sys.exit(1)
 
-
-class AIMLScraperMobile:
-    """Advanced scraper for AIML API documentation (Mobile optimized)"""
-    
-    def __init__(self, output_dir: str = "/sdcard/AIML_API_Docs"):
-        self.output_dir = Path(output_dir)
-        self.temp_dir = self.output_dir / ".temp"
-        self.cache_dir = self.output_dir / ".cache"
-        self.base_url = "https://docs.aimlapi.com"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Linux; Android) AppleWebKit/537.36'
-        })
-        
-        self._setup_directories()
-    
-    def _setup_directories(self):
-        """Create necessary directories"""
-        try:
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-            self.temp_dir.mkdir(exist_ok=True)
-            self.cache_dir.mkdir(exist_ok=True)
-            print(f"[INFO] Storage ready: {self.output_dir}")
-        except PermissionError:
-            print(f"[ERROR] No permission to write to {self.output_dir}")
-            print("[INFO] Run in Termux: termux-setup-storage")
-            sys.exit(1)
-    
-    def _get_cache_path(self, url: str) -> Path:
-        """Generate cache file path from URL"""
-        import hashlib
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        return self.cache_dir / f"{url_hash}.html"
-    
-    def fetch_url(self, url: str, use_cache: bool = True) -> Optional[str]:
-        """Fetch URL with caching"""
-        cache_path = self._get_cache_path(url)
-        
-        if use_cache and cache_path.exists():
-            print(f"[CACHE] Using cached version: {url}")
-            return cache_path.read_text(encoding='utf-8')
-        
-        try:
-            print(f"[FETCH] Retrieving: {url}")
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            # Cache the response
-            cache_path.write_text(response.text, encoding='utf-8')
-            return response.text
-        except requests.RequestException as e:
-            print(f"[ERROR] Failed to fetch {url}: {e}")
-            return None
-    
-    def find_model_url(self, model_name: str) -> Optional[str]:
-        """Find documentation URL for a model"""
-        print(f"[SEARCH] Looking for model: {model_name}")
-        
-        # Map common model prefixes to their provider paths
-        provider_map = {
-            'gpt-': 'openai',
-            'o1': 'openai',
-            'o3': 'openai',
-            'o4': 'openai',
-            'claude-': 'anthropic',
-            'deepseek-': 'deepseek',
-            'gemini-': 'google',
-            'mistral-': 'mistral-ai',
-            'llama-': 'meta',
-            'qwen-': 'alibaba-cloud',
-            'moonshot-': 'moonshot',
-            'command-': 'cohere',
-            'grok-': 'xai',
-        }
-        
-        provider = None
-        for prefix, prov in provider_map.items():
-            if model_name.lower().startswith(prefix):
-                provider = prov
-                break
-        
-        if not provider:
-            print(f"[WARN] Could not determine provider for: {model_name}")
-            print(f"[INFO] Supported prefixes: {', '.join(provider_map.keys())}")
-            return None
-        
-        model_url = f"{self.base_url}/api-references/text-models-llm/{provider}/{model_name}"
-        print(f"[INFO] Constructed URL: {model_url}")
-        return model_url
-    
-    def extract_api_parameters(self, html: str) -> Dict:
-        """Extract API parameters from HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        parameters = {
-            'required': [],
-            'optional': [],
-            'descriptions': {}
-        }
-        
-        # Look for parameter definitions
-        param_patterns = [
-            r'(?:parameter|param|field)["\']?\s*[:=]?\s*["\']?([a-z_]+)',
-            r'<strong>([a-z_]+)</strong>\s*(?:string|integer|number|boolean|array|object)',
-            r'`([a-z_]+)`\s*(?:\||:|-)',
-        ]
-        
-        text = soup.get_text()
-        
-        for pattern in param_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                param_name = match.lower()
-                if param_name not in parameters['required'] and param_name not in parameters['optional']:
-                    # Try to determine if required
-                    if 'required' in text[max(0, text.find(param_name)-100):text.find(param_name)+100].lower():
-                        parameters['required'].append(param_name)
-                    else:
-                        parameters['optional'].append(param_name)
-        
-        return parameters
-    
-    def extract_code_examples(self, html: str) -> Dict[str, str]:
-        """Extract code examples from documentation"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        examples = {}
-        
-        # Find code blocks
-        code_blocks = soup.find_all('code')
-        
-        for i, code in enumerate(code_blocks):
-            code_text = code.get_text()
-            
-            if 'curl' in code_text.lower():
-                examples['curl'] = code_text
-            elif 'python' in code_text.lower() or 'import' in code_text:
-                examples['python'] = code_text
-            elif 'javascript' in code_text.lower() or 'async' in code_text:
-                examples['javascript'] = code_text
-            elif 'bash' in code_text.lower():
-                examples['bash'] = code_text
-        
-        return examples
-    
-    def extract_model_info(self, html: str) -> Dict:
-        """Extract model information from HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
-        text = soup.get_text()
-        
-        info = {
-            'description': '',
-            'capabilities': [],
-            'endpoints': [],
-            'model_ids': []
-        }
-        
-        # Extract description (usually first paragraph)
-        paragraphs = soup.find_all('p')
-        if paragraphs:
-            info['description'] = paragraphs[0].get_text().strip()
-        
-        # Extract endpoints
-        endpoint_pattern = r'https://api\.aimlapi\.com/v1/[a-z/\-]+'
-        endpoints = re.findall(endpoint_pattern, text)
-        info['endpoints'] = list(set(endpoints))
-        
-        # Extract model IDs
-        model_id_pattern = r'(?:model["\']?\s*[:=]\s*["\']?)([a-z0-9\-\.]+)(?:["\'])?'
-        model_ids = re.findall(model_id_pattern, text, re.IGNORECASE)
-        info['model_ids'] = list(set(model_ids))[:15]
-        
-        # Extract capabilities
-        capability_keywords = [
-            'streaming', 'function calling', 'vision', 'audio', 'json', 
-            'tool use', 'reasoning', 'search', 'embeddings', 'moderation'
-        ]
-        
-        for keyword in capability_keywords:
-            if keyword.lower() in text.lower():
-                info['capabilities'].append(keyword)
-        
-        return info
+# Prefer the C-backed lxml parser; fall back to the stdlib parser if missing
+try:
+    from lxml import etree, html as lxml_html
+    HTML_PARSER = 'lxml'
     
-    def generate_context_md(self, model_name: str, model_url: str, 
-                           html: str) -> str:
-        """Generate comprehensive context.md file"""
-        
-        output_file = str(self.output_dir / f"{model_name}_context.md")
-        
-        print(f"[GENERATE] Creating context file: {output_file}")
-        
-        # Extract information
-        model_info = self.extract_model_info(html)
-        parameters = self.extract_api_parameters(html)
-        examples = self.extract_code_examples(html)
-        
-        # Build markdown content
-        md_content = f"""# AIML API Documentation Context: {model_name}
+    # Endpoints are normally tagged as links or inline code
+    _ENDPOINT_XPATH = etree.XPath(
+        '//a/@href[starts-with(., "https://api.aimlapi.com/v1/")]'
+        ' | //code[contains(., "api.aimlapi.com")]//text()'
+    )
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = 'html.parser'
+
+# The extractors only walk <p> and <code> nodes, so skip building the rest
+_CONTENT_STRAINER = SoupStrainer(['p', 'code'])
+
+# Patterns compiled once at import instead of on every extract call
+# Parameter definitions: "param: x", "<strong>x</strong> type" or "`x` |",
+# fused into one alternation so the text is scanned once
+_PARAM_RE = re.compile(
+    r'(?:(?:parameter|param|field)["\']?\s*[:=]?\s*["\']?(?P<a>[a-z_]+))'
+    r'|(?:<strong>(?P<b>[a-z_]+)</strong>\s*(?:string|integer|number|boolean|array|object))'
+    r'|(?:`(?P<c>[a-z_]+)`\s*(?:\||:|-))',
+    re.IGNORECASE
+)
+_ENDPOINT_RE = re.compile(r'https://api\.aimlapi\.com/v1/[a-z/\-]+')
+_MODEL_ID_RE = re.compile(
+    r'(?:model["\']?\s*[:=]\s*["\']?)([a-z0-9\-\.]+)(?:["\'])?', re.IGNORECASE
+)
+
+_CAPABILITY_KEYWORDS = (
+    'streaming', 'function calling', 'vision', 'audio', 'json',
+    'tool use', 'reasoning', 'search', 'embeddings', 'moderation'
+)
+# One scan over the page text instead of one `in` check per keyword
+_CAPABILITY_RE = re.compile('|'.join(map(re.escape, _CAPABILITY_KEYWORDS)), re.IGNORECASE)
+
+# Responses smaller than this are usually error/redirect stubs; don't cache them
+CACHE_MIN_BYTES = 512
+CHUNK_SIZE = 65536
+# Cap the on-disk cache so hot pages stay in the OS page cache
+CACHE_MAX_BYTES = 50 * 1024 * 1024
 
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+# Concurrent model scrapes (see main)
+MAX_WORKERS = 8
+
+# Status output goes through logging (thread-safe, lazily formatted)
+logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+logger = logging.getLogger('aiml')
+
+
+# Markdown skeleton for generated context files, filled via str.format_map
+# (literal braces are doubled)
+_CONTEXT_TEMPLATE = """# AIML API Documentation Context: {model_name}
+
+**Generated**: {timestamp}
 **Model**: {model_name}
 **Source**: {model_url}
 
@@ -252,11 +114,11 @@ class AIMLScraperMobile:
 
 ### Description
 
-{model_info['description'] or 'See documentation for details.'}
+{description}
 
 ### Capabilities
 
-{self._format_list(model_info['capabilities']) if model_info['capabilities'] else '- Standard text generation capabilities'}
+{capabilities}
 
 ### Documentation
 
@@ -300,7 +162,7 @@ source ~/.bashrc
 
 ### Available Endpoints
 
-{self._format_list(model_info['endpoints']) if model_info['endpoints'] else '- `POST https://api.aimlapi.com/v1/chat/completions`'}
+{endpoints}
 
 ### Primary Endpoint
 
@@ -500,7 +362,7 @@ def call_with_retry(client, model, messages, max_retries=3):
         except Exception as e:
             if attempt < max_retries - 1:
                 wait = (2 ** attempt) + random.uniform(0, 1)
-                print(f"Retry {attempt + 1}/{max_retries} in {wait:.2f}s")
+                print(f"Retry {{attempt + 1}}/{{max_retries}} in {{wait:.2f}}s")
                 time.sleep(wait)
             else:
                 raise
@@ -539,7 +401,7 @@ Check https://aimlapi.com/pricing for current rates.
 
 The following model IDs are available for {model_name}:
 
-{self._format_list(model_info['model_ids']) if model_info['model_ids'] else '- See documentation for available model IDs'}
+{model_ids}
 
 ---
 
@@ -573,17 +435,330 @@ Use this to help users:
 
 ---
 
-**Last Updated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Last Updated**: {timestamp}
 **Model**: {model_name}
 **API Version**: v1
 **Storage**: /sdcard/AIML_API_Docs/
 """
+
+
+class AIMLScraperMobile:
+    """Advanced scraper for AIML API documentation (Mobile optimized)"""
+    
+    # Map common model prefixes to their provider paths
+    _PROVIDER_MAP = {
+        'gpt-': 'openai',
+        'o1': 'openai',
+        'o3': 'openai',
+        'o4': 'openai',
+        'claude-': 'anthropic',
+        'deepseek-': 'deepseek',
+        'gemini-': 'google',
+        'mistral-': 'mistral-ai',
+        'llama-': 'meta',
+        'qwen-': 'alibaba-cloud',
+        'moonshot-': 'moonshot',
+        'command-': 'cohere',
+        'grok-': 'xai',
+    }
+    # Single anchored match over all prefixes (first listed prefix wins)
+    _PROVIDER_RE = re.compile('|'.join(map(re.escape, _PROVIDER_MAP)), re.IGNORECASE)
+    
+    def __init__(self, output_dir: str = "/sdcard/AIML_API_Docs"):
+        self.output_dir = Path(output_dir)
+        self.temp_dir = self.output_dir / ".temp"
+        self.cache_dir = self.output_dir / ".cache"
+        self.base_url = "https://docs.aimlapi.com"
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Linux; Android) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+        
+        # Pooled keep-alive connections with backoff on throttling/server errors
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+        self.session.mount('https://', adapter)
+        
+        self._setup_directories()
+        self._cache_bytes = self._evict_cache()
+    
+    def _setup_directories(self):
+        """Create necessary directories"""
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self.temp_dir.mkdir(exist_ok=True)
+            self.cache_dir.mkdir(exist_ok=True)
+            logger.info("[INFO] Storage ready: %s", self.output_dir)
+        except PermissionError:
+            logger.error("[ERROR] No permission to write to %s", self.output_dir)
+            logger.info("[INFO] Run in Termux: termux-setup-storage")
+            sys.exit(1)
+    
+    def _evict_cache(self) -> int:
+        """Delete least recently used cache files until under CACHE_MAX_BYTES"""
+        entries = []
+        total = 0
+        for path in self.cache_dir.iterdir():
+            if path.suffix == '.tmp':
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        
+        if total > CACHE_MAX_BYTES:
+            entries.sort()
+            for _, size, path in entries:
+                path.unlink(missing_ok=True)
+                total -= size
+                if total <= CACHE_MAX_BYTES:
+                    break
+            logger.info("[CACHE] Evicted old entries, cache now %.1f MB", total / 1024 / 1024)
+        
+        return total
+    
+    def _get_cache_path(self, url: str) -> Path:
+        """Generate cache file path from URL"""
+        url_hash = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{url_hash}.html.gz"
+    
+    def fetch_url(self, url: str, use_cache: bool = True) -> Optional[str]:
+        """Fetch URL with caching"""
+        cache_path = self._get_cache_path(url)
+        
+        if use_cache and cache_path.exists():
+            logger.info("[CACHE] Using cached version: %s", url)
+            cache_path.touch()  # mtime doubles as the LRU timestamp
+            return gzip.decompress(cache_path.read_bytes()).decode('utf-8', errors='replace')
+        
+        try:
+            logger.info("[FETCH] Retrieving: %s", url)
+            with self.session.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                return self._stream_to_cache(response, cache_path)
+        except requests.RequestException as e:
+            logger.error("[ERROR] Failed to fetch %s: %s", url, e)
+            return None
+    
+    def _stream_to_cache(self, response: requests.Response, cache_path: Path) -> str:
+        """Stream a response body into the gzip cache and return its text
+        
+        The body is decoded with the server's declared charset (UTF-8 if
+        none) and cached as UTF-8, which is how cache hits are read back.
+        """
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        
+        if response.status_code != 200:
+            body = b''.join(response.iter_content(CHUNK_SIZE))
+            return decoder.decode(body, final=True)
+        
+        # Compress chunks as they arrive (docs HTML shrinks ~5-10x, which
+        # matters on slow sdcard flash) rather than holding a second copy
+        parts = []
+        size = 0
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    size += len(chunk)
+                    text = decoder.decode(chunk)
+                    f.write(text.encode('utf-8'))
+                    parts.append(text)
+                text = decoder.decode(b'', final=True)
+                f.write(text.encode('utf-8'))
+                parts.append(text)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        body = ''.join(parts)
+        if size >= CACHE_MIN_BYTES:
+            os.replace(tmp_path, cache_path)
+            self._cache_bytes += cache_path.stat().st_size
+            if self._cache_bytes > CACHE_MAX_BYTES:
+                self._cache_bytes = self._evict_cache()
+        else:
+            tmp_path.unlink()
+        return body
+    
+    def find_model_url(self, model_name: str) -> Optional[str]:
+        """Find documentation URL for a model"""
+        logger.info("[SEARCH] Looking for model: %s", model_name)
         
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        match = self._PROVIDER_RE.match(model_name)
+        if not match:
+            logger.warning("[WARN] Could not determine provider for: %s", model_name)
+            logger.info("[INFO] Supported prefixes: %s", ', '.join(self._PROVIDER_MAP.keys()))
+            return None
+        
+        provider = self._PROVIDER_MAP[match.group(0).lower()]
         
-        print(f"[SUCCESS] Context file created: {output_file}")
+        model_url = f"{self.base_url}/api-references/text-models-llm/{provider}/{model_name}"
+        logger.info("[INFO] Constructed URL: %s", model_url)
+        return model_url
+    
+    def _parse_page(self, html: str) -> Tuple[BeautifulSoup, str, Optional[object]]:
+        """Parse HTML into the (soup, text, lxml tree) used by the extractors"""
+        if lxml_html is not None:
+            try:
+                tree = lxml_html.fromstring(html)
+            except (etree.ParserError, ValueError):
+                pass  # Empty or XML-declared document; let BS4 cope with it
+            else:
+                # Only <p>/<code> become BS4 objects; flat text comes straight from lxml
+                etree.strip_elements(tree, 'script', 'style', with_tail=False)
+                soup = BeautifulSoup(html, HTML_PARSER, parse_only=_CONTENT_STRAINER)
+                return soup, tree.text_content(), tree
+
+        # Drop script/style here too so results do not depend on which parser ran
+        soup = BeautifulSoup(html, HTML_PARSER)
+        for tag in soup(['script', 'style']):
+            tag.decompose()
+        return soup, soup.get_text(), None
+    
+    def extract_api_parameters(self, text: str) -> Dict:
+        """Extract API parameters from page text"""
+        parameters = {
+            'required': [],
+            'optional': [],
+            'descriptions': {}
+        }
+        
+        text_lower = text.lower()
+        seen = set()
+        
+        # Look for parameter definitions
+        for match in _PARAM_RE.finditer(text_lower):
+            param_name = match.group(match.lastgroup)
+            if param_name in seen:
+                continue
+            seen.add(param_name)
+            
+            # Try to determine if required (look around the match itself)
+            start, end = match.span(match.lastgroup)
+            if 'required' in text_lower[max(0, start - 100):end + 100]:
+                parameters['required'].append(param_name)
+            else:
+                parameters['optional'].append(param_name)
+        
+        return parameters
+    
+    def extract_code_examples(self, soup: BeautifulSoup) -> Dict[str, str]:
+        """Extract code examples from documentation"""
+        examples = {}
+        
+        # Find code blocks
+        code_blocks = soup.find_all('code')
+        
+        for code in code_blocks:
+            code_text = code.get_text()
+            code_lower = code_text.lower()
+            
+            if 'curl' in code_lower:
+                examples['curl'] = code_text
+            elif 'python' in code_lower or 'import' in code_text:
+                examples['python'] = code_text
+            elif 'javascript' in code_lower or 'async' in code_text:
+                examples['javascript'] = code_text
+            elif 'bash' in code_lower:
+                examples['bash'] = code_text
+        
+        return examples
+    
+    def extract_endpoints(self, text: str, tree=None) -> List[str]:
+        """Extract API endpoints, preferring tagged links/code over a text scan"""
+        endpoints = set()
+        
+        if tree is not None:
+            for snippet in _ENDPOINT_XPATH(tree):
+                endpoints.update(_ENDPOINT_RE.findall(snippet))
+        
+        # Fall back to scanning the whole page text
+        if not endpoints:
+            endpoints.update(_ENDPOINT_RE.findall(text))
+        
+        return list(endpoints)
+    
+    def extract_model_info(self, soup: BeautifulSoup, text: str, tree=None) -> Dict:
+        """Extract model information from parsed page"""
+        info = {
+            'description': '',
+            'capabilities': [],
+            'endpoints': [],
+            'model_ids': []
+        }
+        
+        # Extract description (usually first paragraph)
+        paragraphs = soup.find_all('p')
+        if paragraphs:
+            info['description'] = paragraphs[0].get_text().strip()
+        
+        # Extract endpoints
+        info['endpoints'] = self.extract_endpoints(text, tree)
+        
+        # Extract model IDs
+        model_ids = _MODEL_ID_RE.findall(text)
+        info['model_ids'] = list(set(model_ids))[:15]
+        
+        # Extract capabilities (reported in keyword order)
+        found = {match.lower() for match in _CAPABILITY_RE.findall(text)}
+        info['capabilities'] = [kw for kw in _CAPABILITY_KEYWORDS if kw in found]
+        
+        return info
+    
+    def generate_context_md(self, model_name: str, model_url: str, 
+                           html: str) -> str:
+        """Generate comprehensive context.md file"""
+        
+        output_file = str(self.output_dir / f"{model_name}_context.md")
+        
+        logger.info("[GENERATE] Creating context file: %s", output_file)
+        
+        # Parse once and share the tree/text across extractors
+        soup, text, tree = self._parse_page(html)
+        
+        # Extract information
+        model_info = self.extract_model_info(soup, text, tree)
+        parameters = self.extract_api_parameters(text)
+        examples = self.extract_code_examples(soup)
+        
+        fields = {
+            'model_name': model_name,
+            'model_url': model_url,
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'description': model_info['description'] or 'See documentation for details.',
+            'capabilities': (self._format_list(model_info['capabilities'])
+                             if model_info['capabilities']
+                             else '- Standard text generation capabilities'),
+            'endpoints': (self._format_list(model_info['endpoints'])
+                          if model_info['endpoints']
+                          else '- `POST https://api.aimlapi.com/v1/chat/completions`'),
+            'model_ids': (self._format_list(model_info['model_ids'])
+                          if model_info['model_ids']
+                          else '- See documentation for available model IDs'),
+        }
+        
+        # Build markdown content
+        md_content = _CONTEXT_TEMPLATE.format_map(fields)
+        
+        # Write to file (single binary write, swapped into place atomically)
+        tmp_path = Path(output_file + '.tmp')
+        tmp_path.write_bytes(md_content.encode('utf-8'))
+        os.replace(tmp_path, output_file)
+        
+        logger.info("[SUCCESS] Context file created: %s", output_file)
         return output_file
     
     @staticmethod
@@ -591,11 +766,11 @@ Use this to help users:
         """Format list as markdown bullet points"""
         if not items:
             return "- No items"
-        return '\n'.join([f"- {item}" for item in items])
+        return '\n'.join(f"- {item}" for item in items)
     
     def scrape_model(self, model_name: str) -> Optional[str]:
         """Main scraping workflow"""
-        print(f"\n[START] Scraping documentation for: {model_name}\n")
+        logger.info("\n[START] Scraping documentation for: %s\n", model_name)
         
         # Find model URL
         model_url = self.find_model_url(model_name)
@@ -610,7 +785,7 @@ Use this to help users:
         # Save raw HTML for debugging
         raw_html_path = self.temp_dir / f"{model_name}_raw.html"
         raw_html_path.write_text(html, encoding='utf-8')
-        print(f"[DEBUG] Raw HTML saved to: {raw_html_path}")
+        logger.info("[DEBUG] Raw HTML saved to: %s", raw_html_path)
         
         # Generate context file
         context_file = self.generate_context_md(
@@ -619,9 +794,9 @@ Use this to help users:
             html
         )
         
-        print(f"\n[COMPLETE] Scraping finished!")
-        print(f"[OUTPUT] Context file: {context_file}")
-        print(f"[OUTPUT] Access via Files app: AIML_API_Docs/{model_name}_context.md")
+        logger.info("\n[COMPLETE] Scraping finished!")
+        logger.info("[OUTPUT] Context file: %s", context_file)
+        logger.info("[OUTPUT] Access via Files app: AIML_API_Docs/%s_context.md", model_name)
         
         return context_file
 
@@ -630,21 +805,30 @@ def main():
     """Main entry point"""
     if len(sys.argv) < 2:
         print("AIML API Documentation Scraper (Mobile)")
-        print("\nUsage: python3 aiml_advanced_scraper_mobile.py <model_name>")
+        print("\nUsage: python3 aiml_advanced_scraper_mobile.py <model_name> [<model_name> ...]")
         print("\nExamples:")
         print("  python3 aiml_advanced_scraper_mobile.py gpt-4o")
         print("  python3 aiml_advanced_scraper_mobile.py claude-3-sonnet")
         print("  python3 aiml_advanced_scraper_mobile.py deepseek-chat")
+        print("  python3 aiml_advanced_scraper_mobile.py gpt-4o claude-3-sonnet deepseek-chat")
         print("\nFiles will be saved to: /sdcard/AIML_API_Docs/")
         print("Access via your phone's Files app")
         sys.exit(1)
     
-    model_name = sys.argv[1]
+    # Drop duplicates but keep the order given on the command line
+    model_names = list(dict.fromkeys(sys.argv[1:]))
     
     scraper = AIMLScraperMobile()
-    result = scraper.scrape_model(model_name)
     
-    sys.exit(0 if result else 1)
+    if len(model_names) == 1:
+        results = [scraper.scrape_model(model_names[0])]
+    else:
+        # Fetching is I/O-bound; overlap the network waits across models
+        workers = min(MAX_WORKERS, len(model_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(scraper.scrape_model, model_names))
+    
+    sys.exit(0 if all(results) else 1)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ Improved version with AI feedback incorporated
 - Logging support
 """
 
-import requests
+import codecs
 import json
 import re
 import os
@@ -17,24 +17,150 @@ import sys
 import time
 import logging
 import hashlib
+import asyncio
+import contextlib
+import functools
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 # Check for termux-setup-storage
-try:
-    import subprocess
-    result = subprocess.run(['test', '-d', '/sdcard'], capture_output=True)
-    SDCARD_AVAILABLE = result.returncode == 0
-except:
-    SDCARD_AVAILABLE = False
+SDCARD_AVAILABLE = os.path.isdir('/sdcard')
+
+# The HTTP and HTML libraries are imported by _load_scraping_libs() when the
+# first session or scraper is created, so `help` and `list` start without
+# them; until then (or when an optional one is missing) each name is None
+requests = HTTPAdapter = Retry = None
+BeautifulSoup = EncodingDetector = None
+etree = lxml_html = None
+HTML_PARSER = 'html.parser'
+LexborHTMLParser = None
+aiohttp = httpx = requests_cache = None
 
+# Optional: orjson reads and writes the JSON outputs and caches several times faster
 try:
-    from bs4 import BeautifulSoup
+    import orjson
 except ImportError:
-    print("Error: beautifulsoup4 not installed. Run: pip install beautifulsoup4")
-    sys.exit(1)
+    orjson = None
+
+# Raw HTML (text or bytes) or a tree already built by BaseScraper._parse
+PageTree = Union[str, bytes, 'BeautifulSoup', 'lxml_html.HtmlElement', 'LexborHTMLParser']
+
+# Tags collected by BaseScraper._extract_structure, in one pass
+_STRUCTURE_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'code', 'pre', 'table')
+_STRUCTURE_SELECTOR = ', '.join(_STRUCTURE_TAGS)  # selectolax's single-query form
+
+# The <main> element of a page; everything the scrapers keep lives inside it
+_MAIN_RE = re.compile(rb'<main(?:\s[^>]*)?>.*?</main\s*>', re.DOTALL | re.IGNORECASE)
+
+# Selectors that name a single tag are resolved with a plain tag search
+# (no soupsieve on BS4 trees, no cssselect on lxml trees)
+_TAG_SELECTOR_RE = re.compile(r'[A-Za-z][A-Za-z0-9-]*')
+
+# Response bodies are streamed (and hashed) in chunks of this size
+FETCH_CHUNK_SIZE = 65536
+
+# Pages whose <main> is at least this large are extracted with lxml's pull
+# parser, which never holds the whole tree (see _PullExtractor)
+STREAM_EXTRACT_MIN_BYTES = 1 << 20
+
+# Bytes of page bodies each scraper keeps in memory after fetching, so a URL
+# reached twice in one run is downloaded (and, being unchanged, parsed) only
+# once. Kept small so long batches stay flat on low-memory devices; a larger
+# page is not remembered at all
+FETCH_MEMO_BYTES = 2 << 20
+
+# Providers that publish an llms.txt: a markdown index of links to their docs.
+# With --llms-txt it is saved instead of scraping the models page (falls back
+# to HTML if unavailable); off by default since it is a list of URLs, not docs
+LLMS_TXT_URLS = {
+    'openai': 'https://platform.openai.com/llms.txt',
+    'anthropic': 'https://docs.anthropic.com/llms.txt',
+    'mistral': 'https://docs.mistral.ai/llms.txt',
+    'cohere': 'https://docs.cohere.com/llms.txt',
+}
+
+# Seconds between requests to each provider's docs host (others use
+# ScraperConfig.request_delay); override with SCRAPER_RATE_LIMIT_<PROVIDER>,
+# e.g. SCRAPER_RATE_LIMIT_ANTHROPIC=2
+PROVIDER_RATE_LIMITS = {
+    'aimlapi': 1.0,
+    'openai': 0.5,
+    'anthropic': 0.5,
+    'google': 0.3,
+    'deepseek': 1.0,
+    'mistral': 0.5,
+    'cohere': 0.5,
+}
+
+# Whitespace cleanup for extract_text: every line break str.splitlines knows
+# becomes \n (one C-level translate), runs of 2+ spaces break a phrase, then
+# lines are stripped and blank lines dropped
+_LINE_BREAKS = str.maketrans(dict.fromkeys('\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029', '\n'))
+_MULTISPACE_RE = re.compile(r' {2,}')
+_BLANK_LINES_RE = re.compile(r'\s*\n\s*')
+
+
+@functools.lru_cache(maxsize=1)
+def _load_scraping_libs():
+    """Import requests, BeautifulSoup and the optional fetch/parse backends, once"""
+    global requests, HTTPAdapter, Retry, BeautifulSoup, EncodingDetector
+    global etree, lxml_html, HTML_PARSER, LexborHTMLParser, aiohttp, httpx, requests_cache
+    
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    try:
+        from bs4 import BeautifulSoup
+        from bs4.dammit import EncodingDetector
+    except ImportError:
+        print("Error: beautifulsoup4 not installed. Run: pip install beautifulsoup4")
+        sys.exit(1)
+    
+    # Prefer the C-backed lxml parser; fall back to the stdlib parser if missing
+    try:
+        from lxml import etree
+        from lxml import html as lxml_html
+        HTML_PARSER = 'lxml'
+    except ImportError:
+        pass
+    
+    # Optional: selectolax's Lexbor engine is much faster than BS4 for extraction
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        pass
+    
+    # Optional: aiohttp powers ScraperOrchestrator.scrape_all_async
+    try:
+        import aiohttp
+    except ImportError:
+        pass
+    
+    # Optional: httpx with h2 lets scrape_all_async multiplex each host over HTTP/2
+    try:
+        import httpx
+        import h2  # noqa: F401 - required by httpx for http2=True
+    except ImportError:
+        httpx = None
+    
+    # Optional: requests-cache gives create_session an on-disk, Cache-Control aware cache
+    try:
+        import requests_cache
+    except ImportError:
+        pass
+
+
+@functools.lru_cache(maxsize=32)
+def _compiled_css(selector: str):
+    """Translate a CSS selector to a compiled lxml XPath matcher, once per selector"""
+    from lxml.cssselect import CSSSelector  # Needs the cssselect package
+    return CSSSelector(selector)
 
 
 # Configure logging
@@ -68,7 +194,7 @@ class ScraperConfig:
         self.timeout = 30
         self.max_retries = 3
         self.retry_delay = 2
-        self.request_delay = 1.0  # Delay between requests (rate limiting)
+        self.request_delay = 1.0  # Delay between requests to hosts without a PROVIDER_RATE_LIMITS entry
         self.user_agent = "ModelDocs-Scraper/2.0 (Mobile; Android; Termux)"
         self.verify_ssl = True
         
@@ -85,12 +211,13 @@ class ScraperConfig:
             self.use_sdcard = False
         
         self.cache_dir = Path.home() / "aiml-scraper" / "cache"
+        self.http_cache_expire = 3600  # Seconds a requests-cache entry or in-memory page stays fresh
         self.min_content_length = 100  # Minimum characters for valid content
         self.low_memory_mode = False  # For future streaming support
         self.verbose = False  # Show HTML content on empty scrapes
-        
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.prefer_llms_txt = False  # Save a provider's llms.txt link index instead of its models page
+        self.workers = 8  # Parallel scrape threads; also sizes the HTTP connection pool
+        self._dirs_ready = False  # Directories are created on first write
         
         # Log which directory is being used
         location = "SD Card (/sdcard/)" if self.use_sdcard else "Home Directory"
@@ -103,153 +230,772 @@ class ScraperConfig:
             return test_dir.exists() and os.access(test_dir, os.W_OK)
         except Exception:
             return False
+    
+    def ensure_dirs(self):
+        """Create the output and cache directories (once) before the first write"""
+        if not self._dirs_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._dirs_ready = True
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_config() -> ScraperConfig:
+    """Shared configuration for scrapers constructed without one"""
+    return ScraperConfig()
+
+
+def provider_rate_limit(provider: Optional[str], default: float) -> float:
+    """Seconds to leave between requests to a provider's docs host"""
+    if provider:
+        override = os.environ.get(f"SCRAPER_RATE_LIMIT_{provider.upper()}")
+        if override:
+            try:
+                return max(0.0, float(override))
+            except ValueError:
+                logger.warning(f"Ignoring invalid SCRAPER_RATE_LIMIT_{provider.upper()}={override!r}")
+        return PROVIDER_RATE_LIMITS.get(provider, default)
+    return default
+
+
+class HostRateLimiter:
+    """Minimum spacing between requests to each host, shared across threads"""
+    
+    def __init__(self):
+        self._next_slot: Dict[str, float] = {}  # host -> earliest time for next request
+        self._lock = threading.Lock()
+    
+    def wait(self, url: str, interval: float):
+        """Block until a request to url's host is allowed, reserving that slot"""
+        host = urlparse(url).netloc
+        # Reserve the next slot under the lock, then sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + interval
+        if slot > now:
+            time.sleep(slot - now)
+            _get_profile().add_time('sleep', slot - now)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_rate_limiter() -> HostRateLimiter:
+    """Process-wide limiter, so scrapers hitting one host share its budget"""
+    return HostRateLimiter()
+
+
+class ScrapeProfile:
+    """Time per stage plus fetch attempts and errors per host, for --profile
+    
+    Failed attempts and retries are counted too, not just successful
+    requests. Stage times are summed over threads, so with parallel
+    workers they can add up to more than the wall-clock time.
+    """
+    
+    STAGES = ('fetch', 'parse', 'write', 'sleep')
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.attempts = Counter()  # attempts a fetch took -> number of fetches
+        self.host_attempts = Counter()
+        self.host_errors: Dict[str, Counter] = defaultdict(Counter)
+    
+    def add_time(self, stage: str, seconds: float):
+        with self._lock:
+            self.seconds[stage] += seconds
+    
+    @contextlib.contextmanager
+    def timed(self, stage: str):
+        """Add the time spent in the with-block to stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start)
+    
+    def record_fetch(self, url: str, attempts: int):
+        with self._lock:
+            self.attempts[attempts] += 1
+            self.host_attempts[urlparse(url).netloc] += attempts
+    
+    def record_errors(self, url: str, errors: List[str]):
+        """Count failed attempts by error class (or HTTP status) for url's host"""
+        if errors:
+            with self._lock:
+                self.host_errors[urlparse(url).netloc].update(errors)
+    
+    def report(self, wall: float) -> str:
+        stages = ' '.join(f"{stage}={self.seconds[stage]:.1f}s" for stage in self.STAGES)
+        retries = ','.join(f"{attempts}:{count}" for attempts, count in sorted(self.attempts.items()))
+        lines = [f"wall={wall:.1f}s {stages} retries={{{retries}}}"]
+        for host in sorted(self.host_attempts):
+            line = f"  {host}: {self.host_attempts[host]} attempt(s)"
+            errors = self.host_errors.get(host)
+            if errors:
+                line += ", errors: " + ', '.join(f"{name}={count}" for name, count in errors.most_common())
+            lines.append(line)
+        return '\n'.join(lines)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_profile() -> ScrapeProfile:
+    """Process-wide stage timings, printed by `scrape --profile`"""
+    return ScrapeProfile()
+
+
+def _retry_history(response) -> Tuple[int, List[str]]:
+    """Attempts urllib3 made for a response, and why the retried ones failed"""
+    retries = getattr(getattr(response, 'raw', None), 'retries', None)
+    history = [entry for entry in getattr(retries, 'history', ()) if not entry.redirect_location]
+    errors = [type(entry.error).__name__ if entry.error else f"HTTP {entry.status}"
+              for entry in history]
+    return len(history) + 1, errors
+
+
+def create_session(config: ScraperConfig) -> 'requests.Session':
+    """Create a pooled, retrying HTTP session that scrapers can share
+    
+    With requests-cache installed the session also caches responses on disk
+    (honouring Cache-Control, ETag and Last-Modified) across runs.
+    """
+    _load_scraping_libs()
+    if requests_cache is not None:
+        config.ensure_dirs()
+        session = requests_cache.CachedSession(
+            cache_name=str(config.cache_dir / 'http'),
+            backend='sqlite',
+            expire_after=config.http_cache_expire,
+            cache_control=True,
+            stale_if_error=True  # Serve the cached copy if the docs site is down
+        )
+    else:
+        session = requests.Session()
+    session.headers.update({"User-Agent": config.user_agent})
+    
+    # Retries happen inside urllib3 on the pooled (kept-alive) connection
+    retry = Retry(
+        total=config.max_retries,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET']
+    )
+    # One pool per host; each can hold a kept-alive socket for every worker
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(10, config.workers * 2),
+                          max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class _PullExtractor:
+    """Incremental form of BaseScraper.extract_all's lxml tree walk
+    
+    Fed the events of an lxml pull parser, it collects the page's text and
+    each header, code block and table as soon as the element closes, and
+    deletes elements once their text is recorded. Peak memory is roughly
+    the extracted output plus the open elements, not the whole tree.
+    Results match _extract_structure and extract_text on the same tree.
+    """
+    
+    def __init__(self):
+        self.visible = []  # Recent text outside <script>/<style>, in document order
+        self.visible_chunks = []  # Older visible text, joined in blocks
+        self.visible_length = 0
+        self.main = None  # [start, end] offsets into the visible text of the first <main>
+        self.main_element = None
+        self.pieces = []  # All text since the outermost open header/code/cell started
+        self.spans = {}  # Open header/code/cell element -> index of its first piece
+        self.slots = {}  # Open header/code/table element -> its placeholder in the results
+        self.skip_depth = 0  # Open <script>/<style> elements
+        self.open_tables = []  # Row lists of the open tables, innermost last
+        self.open_rows = []  # Cell lists of the open rows, innermost last
+        self.headers = []
+        self.code_blocks = []
+        self.tables = []
+    
+    def _emit(self, text: Optional[str]):
+        if not text:
+            return
+        if self.spans:
+            self.pieces.append(text)
+        if not self.skip_depth:
+            self.visible.append(text)
+            self.visible_length += len(text)
+            if len(self.visible) >= 4096:
+                self.visible_chunks.append(''.join(self.visible))
+                self.visible = []
+    
+    def _emit_after(self, node, fallback: Optional[str]):
+        """Emit the text following node (the parent's text if node is None)
+        
+        Comments have no events, so their tails are collected here too.
+        """
+        tails = []
+        while node is not None and not isinstance(node.tag, str):
+            tails.append(node.tail)
+            node = node.getprevious()
+        self._emit(node.tail if node is not None else fallback)
+        for tail in reversed(tails):
+            self._emit(tail)
+    
+    def _start(self, element):
+        parent = element.getparent()
+        if parent is not None:
+            # The parent's text or previous sibling's tail is complete now,
+            # and every earlier sibling has been fully recorded
+            self._emit_after(element.getprevious(), parent.text)
+            for sibling in list(element.itersiblings(preceding=True)):
+                parent.remove(sibling)
+        tag = element.tag
+        
+        if tag in ('script', 'style'):
+            self.skip_depth += 1
+        elif tag == 'main' and self.main is None:
+            self.main, self.main_element = [self.visible_length, None], element
+        
+        if tag == 'table':
+            rows = []
+            self.slots[element] = [rows]
+            self.tables.append(self.slots[element])
+            self.open_tables.append(rows)
+        elif tag == 'tr':
+            # Like node.iter('tr'): a row belongs to every enclosing table
+            cells = []
+            for rows in self.open_tables:
+                rows.append(cells)
+            self.open_rows.append(cells)
+        elif tag in ('td', 'th'):
+            cell = [None]
+            for cells in self.open_rows:
+                cells.append(cell)
+            self.slots[element] = cell
+            self.spans[element] = len(self.pieces)
+        elif tag in _STRUCTURE_TAGS:
+            slot = [None, element.get('class'), element.get('data-language')]
+            self.slots[element] = slot
+            (self.code_blocks if tag in ('code', 'pre') else self.headers).append(slot)
+            self.spans[element] = len(self.pieces)
+    
+    def _end(self, element):
+        last = element[-1] if len(element) else None
+        self._emit_after(last, element.text)
+        tag = element.tag
+        
+        if tag in ('script', 'style'):
+            self.skip_depth -= 1
+        elif element is self.main_element:
+            self.main[1] = self.visible_length
+            self.main_element = None
+        
+        start = self.spans.pop(element, None)
+        text = ''.join(self.pieces[start:]) if start is not None else None
+        if not self.spans:
+            self.pieces = []
+        slot = self.slots.pop(element, None)
+        
+        if tag == 'table':
+            rows = [[cell[0] for cell in cells] for cells in self.open_tables.pop()]
+            rows = [cells for cells in rows if cells]
+            slot[0] = {'headers': rows[0], 'rows': rows[1:]} if rows else None
+        elif tag == 'tr':
+            self.open_rows.pop()
+        elif tag in ('td', 'th'):
+            slot[0] = text.strip()
+        elif tag in ('code', 'pre'):
+            classes, data_language = slot[1], slot[2]
+            if text.strip():
+                slot[0] = {
+                    'language': BaseScraper._detect_language((classes or '').split(), data_language),
+                    'code': text.strip()
+                }
+        elif slot is not None:
+            text = text.strip()
+            slot[0] = (int(tag[1]), text) if text else None
+        del element[:]  # Everything inside has been recorded
+    
+    def feed(self, events):
+        """Consume (event, element) pairs from parser.read_events()"""
+        for event, element in events:
+            if event == 'start':
+                self._start(element)
+            else:
+                self._end(element)
+    
+    def result(self) -> Dict:
+        """Headers, code blocks, tables and <main> text, as extract_all returns them"""
+        text = ''.join(self.visible_chunks + self.visible)
+        if self.main is None:
+            logger.warning("Selector 'main' not found, using full content")
+        else:
+            text = text[self.main[0]:self.main[1]]
+        return {
+            'headers': [slot[0] for slot in self.headers if slot[0] is not None],
+            'code_blocks': [slot[0] for slot in self.code_blocks if slot[0] is not None],
+            'tables': [slot[0] for slot in self.tables if slot[0] is not None],
+            'text': BaseScraper._clean_text(text)
+        }
 
 
 class BaseScraper:
     """Base class for all scrapers"""
     
-    def __init__(self, config: ScraperConfig = None):
-        self.config = config or ScraperConfig()
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.config.user_agent})
+    def __init__(self, config: ScraperConfig = None, session: 'requests.Session' = None):
+        _load_scraping_libs()
+        self.config = config or _get_default_config()
+        self.session = session or create_session(self.config)
         self.scraped_data = {}
-        self.last_request_time = 0
+        self.rate_limiter = _get_rate_limiter()
+        self.unchanged_urls = set()  # URLs the server answered with 304
+        self.prefetched = {}  # url -> HTML already fetched by AsyncBaseScraper
+        self._fetch_memo = OrderedDict()  # url -> (fetched at, (body, hash)), oldest first
+        self._fetch_memo_bytes = 0  # Total body size held in _fetch_memo
+        self._fetch_memo_lock = threading.Lock()
+        self._url_locks = {}  # url -> lock held while that URL is being fetched
+    
+    def _rate_limit_interval(self) -> float:
+        """Seconds between requests to this scraper's provider"""
+        return provider_rate_limit(getattr(self, 'provider', None), self.config.request_delay)
+    
+    def _apply_rate_limit(self, url: str):
+        """Apply the provider's rate limit to a request to url's host"""
+        self.rate_limiter.wait(url, self._rate_limit_interval())
+    
+    def _http_cache_path(self, url: str) -> Path:
+        """Path (without suffix) of the conditional-GET cache entry for a URL"""
+        return self.config.cache_dir / hashlib.sha256(url.encode()).hexdigest()
     
-    def _apply_rate_limit(self):
-        """Apply rate limiting between requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.config.request_delay:
-            time.sleep(self.config.request_delay - elapsed)
-        self.last_request_time = time.time()
+    def _load_http_cache(self, url: str) -> Optional[Dict]:
+        """Load the cached ETag/Last-Modified entry and raw body for a URL, if any"""
+        path = self._http_cache_path(url)
+        try:
+            entry = self._load_json(path.with_suffix('.json').read_bytes())
+            entry['body'] = path.with_suffix('.html').read_bytes()
+            return entry
+        except (OSError, ValueError):
+            return None
+    
+    def _conditional_headers(self, cached: Optional[Dict]) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from a cache entry"""
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+    
+    def _save_http_cache(self, url: str, headers, body: bytes, content_hash: str):
+        """Remember a response's validators and body for later conditional GETs"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return  # Nothing to revalidate with
+        
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_hash': content_hash
+        }
+        path = self._http_cache_path(url)
+        try:
+            self.config.ensure_dirs()
+            self._write_file(path.with_suffix('.html'), body)
+            self._write_file(path.with_suffix('.json'), self._dump_json(entry))
+        except IOError as e:
+            logger.warning(f"Failed to cache {url}: {e}")
+    
+    def _parsed_cache_path(self, url: str) -> Path:
+        """Where the data scraped from a URL is cached, keyed by the URL"""
+        return self.config.cache_dir / 'parsed' / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+    
+    def _save_parsed(self, url: str, content_hash: str, data: Dict):
+        """Cache the data scraped from a page together with its body hash"""
+        path = self._parsed_cache_path(url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_file(path, self._dump_json({'content_hash': content_hash, 'data': data}))
+        except OSError as e:
+            logger.warning(f"Failed to cache parsed {url}: {e}")
+    
+    def _load_unchanged(self, url: str, output_filenames: List[str],
+                        content_hash: Optional[str] = None) -> Optional[Dict]:
+        """Return previously scraped data if the page is unchanged
+        
+        A page counts as unchanged when the server said so (304 or an HTTP
+        cache hit) or, for servers without validators, when the fetched body
+        hashes the same as the one the cached data was built from. All of
+        the page's output files must still exist, so a deleted one is rebuilt.
+        """
+        if not all((self.config.output_dir / name).exists() for name in output_filenames):
+            return None
+        try:
+            entry = self._load_json(self._parsed_cache_path(url).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if url not in self.unchanged_urls and (
+                content_hash is None or entry.get('content_hash') != content_hash):
+            return None
+        logger.info(f"{url} not modified, keeping {', '.join(output_filenames)}")
+        return entry.get('data')
     
-    def fetch_url(self, url: str) -> Optional[str]:
-        """Fetch URL with retry logic and rate limiting"""
-        self._apply_rate_limit()
+    def fetch_url(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """Fetch URL with rate limiting and conditional GETs
+        
+        Returns the raw body and its sha256 hex digest, or None on failure.
+        The most recent pages, up to FETCH_MEMO_BYTES in total, are
+        remembered for as long as the HTTP cache would keep them
+        (config.http_cache_expire), so fetching one again (even from another
+        thread, mid-download) returns the same result without a second request.
+        """
+        with self._fetch_memo_lock:
+            url_lock = self._url_locks.setdefault(url, threading.Lock())
         
-        for attempt in range(self.config.max_retries):
-            try:
-                logger.info(f"Fetching {url} (attempt {attempt + 1}/{self.config.max_retries})")
-                response = self.session.get(
-                    url,
-                    timeout=self.config.timeout,
-                    verify=self.config.verify_ssl
-                )
+        try:
+            with url_lock:
+                with self._fetch_memo_lock:
+                    fetched_at, fetched = self._fetch_memo.get(url, (0, None))
+                    if fetched is not None:
+                        self._fetch_memo.move_to_end(url)
+                if fetched is not None and time.monotonic() - fetched_at < self.config.http_cache_expire:
+                    logger.debug(f"Already fetched {url} in this run, reusing it")
+                    return fetched
+                
+                fetched = self._fetch(url)
+                if fetched is not None:
+                    self._remember_fetch(url, fetched)
+                return fetched
+        finally:
+            with self._fetch_memo_lock:
+                # Threads already waiting hold their own reference to the lock
+                if self._url_locks.get(url) is url_lock:
+                    del self._url_locks[url]
+    
+    def _remember_fetch(self, url: str, fetched: Tuple[bytes, str]):
+        """Add a page to the fetch memo, evicting the oldest past FETCH_MEMO_BYTES"""
+        size = len(fetched[0])
+        with self._fetch_memo_lock:
+            _, previous = self._fetch_memo.pop(url, (0, None))
+            if previous is not None:
+                self._fetch_memo_bytes -= len(previous[0])
+            if size > FETCH_MEMO_BYTES:
+                return
+            self._fetch_memo[url] = (time.monotonic(), fetched)
+            self._fetch_memo_bytes += size
+            while self._fetch_memo_bytes > FETCH_MEMO_BYTES:
+                _, (_, evicted) = self._fetch_memo.popitem(last=False)
+                self._fetch_memo_bytes -= len(evicted[0])
+    
+    def _fetch(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """Fetch URL over the network (or take it from self.prefetched)"""
+        prefetched = self.prefetched.pop(url, None)
+        if prefetched is not None:
+            return prefetched
+        
+        self._apply_rate_limit(url)
+        
+        # Revalidate against the last copy instead of re-downloading it,
+        # unless requests-cache is already doing that for the session
+        http_cached = requests_cache is not None and isinstance(self.session, requests_cache.CachedSession)
+        cached = None if http_cached else self._load_http_cache(url)
+        headers = self._conditional_headers(cached)
+        
+        profile = _get_profile()
+        response = None
+        try:
+            logger.info(f"Fetching {url}")
+            with profile.timed('fetch'), self.session.get(
+                url,
+                headers=headers,
+                timeout=self.config.timeout,
+                verify=self.config.verify_ssl,
+                stream=True
+            ) as response:
+                attempts, errors = _retry_history(response)
+                profile.record_fetch(url, attempts)
+                profile.record_errors(url, errors)
+                if response.status_code == 304 and cached:
+                    logger.info(f"Not modified, using cached copy of {url}")
+                    self.unchanged_urls.add(url)
+                    return cached['body'], cached['content_hash']
+                
                 response.raise_for_status()
-                logger.info(f"Successfully fetched {url}")
-                return response.text
-            except requests.RequestException as e:
-                logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay)
-                else:
-                    logger.error(f"Failed to fetch {url} after {self.config.max_retries} attempts")
-                    return None
+                
+                # Hash while streaming instead of re-encoding the text later
+                hasher = hashlib.sha256()
+                chunks = []
+                for chunk in response.iter_content(chunk_size=FETCH_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    chunks.append(chunk)
+            
+            body = b''.join(chunks)
+            content_hash = hasher.hexdigest()
+            if getattr(response, 'from_cache', False):
+                logger.info(f"Using HTTP-cached copy of {url}")
+                self.unchanged_urls.add(url)
+                return body, content_hash
+            
+            logger.info(f"Successfully fetched {url}")
+            self.unchanged_urls.discard(url)
+            if not http_cached:
+                self._save_http_cache(url, response.headers, body, content_hash)
+            return body, content_hash
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            # Without a response urllib3 gave up, after its retries if it wraps the reason
+            reason = getattr(e.args[0], 'reason', None) if e.args else None
+            if response is None:
+                profile.record_fetch(url, self.config.max_retries + 1 if reason else 1)
+            profile.record_errors(url, [type(reason or e).__name__])
+            return None
     
-    def extract_text(self, html: str, selector: Optional[str] = None) -> str:
+    def _parse(self, html: PageTree) -> PageTree:
+        """Parse HTML once (selectolax if installed, else BS4), passing through
+        a tree the caller already built"""
+        if not isinstance(html, (str, bytes)):
+            return html
+        if LexborHTMLParser is not None:
+            return self._fast_parse(html)
+        if lxml_html is not None:
+            try:
+                return self._lxml_parse(html)
+            except (etree.ParserError, ValueError, LookupError):
+                pass  # Empty or oddly-declared document; let BS4 cope with it
+        # Decoded up front so BS4 does not fall back to slow statistical
+        # charset detection
+        return BeautifulSoup(self._decode_html(html), HTML_PARSER)
+    
+    @staticmethod
+    def _decode_html(html: Union[str, bytes]) -> str:
+        """Decode page bytes with their declared charset (UTF-8 if none)
+        
+        Shared by every parser backend so they all see the same text;
+        undecodable bytes and unknown charsets degrade to U+FFFD / UTF-8.
+        """
+        if not isinstance(html, bytes):
+            return html
+        declared = EncodingDetector.find_declared_encoding(html, is_html=True)
+        try:
+            return html.decode(declared or 'utf-8', errors='replace')
+        except LookupError:
+            return html.decode('utf-8', errors='replace')
+    
+    def _fast_parse(self, html: Union[str, bytes]) -> 'LexborHTMLParser':
+        """Parse HTML with selectolax's C-backed Lexbor engine
+        
+        Lexbor reads bytes as UTF-8 whatever the page declares, so bytes are
+        decoded with the declared charset first.
+        """
+        return LexborHTMLParser(self._decode_html(html))
+    
+    def _lxml_parse(self, html: Union[str, bytes]) -> 'lxml_html.HtmlElement':
+        """Parse HTML straight into an lxml tree, without a BS4 wrapper"""
+        return lxml_html.document_fromstring(self._decode_html(html))
+    
+    @staticmethod
+    def _is_lxml(tree) -> bool:
+        """Whether a parsed tree is an lxml element"""
+        return etree is not None and isinstance(tree, etree._Element)
+    
+    @staticmethod
+    def _soup_select_one(soup: 'BeautifulSoup', selector: str):
+        """First element matching a CSS selector in a BS4 tree"""
+        if _TAG_SELECTOR_RE.fullmatch(selector):
+            return soup.find(selector)  # Skips soupsieve's selector compile/match
+        return soup.select_one(selector)
+    
+    @staticmethod
+    def _lxml_select_one(tree, selector: str):
+        """First element matching a CSS selector in an lxml tree"""
+        if _TAG_SELECTOR_RE.fullmatch(selector):
+            return next(tree.iter(selector), None)
+        matches = _compiled_css(selector)(tree)
+        return matches[0] if matches else None
+    
+    @staticmethod
+    def _detect_language(classes: List[str], data_language: Optional[str]) -> str:
+        """Detect a code block's language from its class or data-language"""
+        for cls in classes:
+            if 'language-' in cls:
+                return cls.replace('language-', '')
+        return data_language if data_language is not None else 'text'
+    
+    @staticmethod
+    def _clean_text(text: str) -> str:
+        """Normalize line breaks, split on wide gaps and drop blank lines"""
+        text = _MULTISPACE_RE.sub('\n', text.translate(_LINE_BREAKS))
+        return _BLANK_LINES_RE.sub('\n', text).strip()
+    
+    def extract_text(self, html: PageTree, selector: Optional[str] = None) -> str:
         """Extract clean text from HTML with optional content selector"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            tree = self._parse(html)
             
             # If selector provided, extract only that section
-            if selector:
-                content = soup.select_one(selector)
-                if not content:
-                    logger.warning(f"Selector '{selector}' not found, using full content")
-                    content = soup
+            if isinstance(tree, BeautifulSoup):
+                root = tree
+                content = self._soup_select_one(tree, selector) if selector else tree
+            elif self._is_lxml(tree):
+                root = tree
+                content = self._lxml_select_one(tree, selector) if selector else tree
             else:
-                content = soup
+                root = tree.root
+                content = tree.css_first(selector) if selector else tree.root
+            if content is None:
+                logger.warning(f"Selector '{selector}' not found, using full content")
+                content = root
             
-            # Remove script and style elements
-            for script in content(["script", "style"]):
-                script.decompose()
-            
-            # Get text
-            text = content.get_text()
-            
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = '\n'.join(chunk for chunk in chunks if chunk)
+            # Remove script and style elements, then get text
+            if isinstance(tree, BeautifulSoup):
+                for script in content(["script", "style"]):
+                    script.decompose()
+                text = content.get_text()
+            elif self._is_lxml(tree):
+                etree.strip_elements(content, 'script', 'style', with_tail=False)
+                text = content.text_content()
+            else:
+                content.strip_tags(["script", "style"])
+                text = content.text()
             
-            return text
+            return self._clean_text(text)
         except Exception as e:
             logger.error(f"Error extracting text: {e}")
             return ""
     
-    def extract_headers(self, html: str) -> List[Tuple[int, str]]:
-        """Extract header hierarchy from HTML"""
+    def _extract_structure(self, html: PageTree) -> Dict[str, List]:
+        """Collect headers, code blocks and tables in a single pass over the tree"""
+        structure = {'headers': [], 'code_blocks': [], 'tables': []}
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            headers = []
-            
-            for header in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                level = int(header.name[1])
-                text = header.get_text().strip()
-                if text:
-                    headers.append((level, text))
+            tree = self._parse(html)
+            is_soup = isinstance(tree, BeautifulSoup)
+            is_lxml = self._is_lxml(tree)
             
-            return headers
-        except Exception as e:
-            logger.error(f"Error extracting headers: {e}")
-            return []
-    
-    def extract_code_blocks(self, html: str) -> List[Dict[str, str]]:
-        """Extract code blocks from HTML with improved language detection"""
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            code_blocks = []
+            # One walk (BS4, lxml) or one C-level query (selectolax), in document order
+            if is_soup:
+                nodes = tree.find_all(list(_STRUCTURE_TAGS))
+            elif is_lxml:
+                nodes = tree.iter(*_STRUCTURE_TAGS)
+            else:
+                nodes = tree.css(_STRUCTURE_SELECTOR)
             
-            for code_elem in soup.find_all(['code', 'pre']):
-                language = 'text'
+            for node in nodes:
+                tag = node.name if is_soup else node.tag
                 
-                # Try to detect language from class
-                classes = code_elem.get('class', [])
-                for cls in classes:
-                    if 'language-' in cls:
-                        language = cls.replace('language-', '')
-                        break
+                if tag == 'table':
+                    if is_soup:
+                        rows = [[td.get_text().strip() for td in tr.find_all(['td', 'th'])]
+                                for tr in node.find_all('tr')]
+                    elif is_lxml:
+                        rows = [[td.text_content().strip() for td in tr.iter('td', 'th')]
+                                for tr in node.iter('tr')]
+                    else:
+                        rows = [[td.text().strip() for td in tr.css('td, th')]
+                                for tr in node.css('tr')]
+                    rows = [cells for cells in rows if cells]
+                    if rows:
+                        structure['tables'].append({
+                            'headers': rows[0],
+                            'rows': rows[1:]
+                        })
                 
-                # Fallback: check data-language attribute
-                if language == 'text' and 'data-language' in code_elem.attrs:
-                    language = code_elem.get('data-language', 'text')
+                elif tag in ('code', 'pre'):
+                    if is_soup:
+                        classes = node.get('class', [])
+                        data_language = node.get('data-language')
+                        code_text = node.get_text()
+                    elif is_lxml:
+                        classes = (node.get('class') or '').split()
+                        data_language = node.get('data-language')
+                        code_text = node.text_content()
+                    else:
+                        classes = (node.attributes.get('class') or '').split()
+                        data_language = node.attributes.get('data-language')
+                        code_text = node.text()
+                    if code_text.strip():
+                        structure['code_blocks'].append({
+                            'language': self._detect_language(classes, data_language),
+                            'code': code_text.strip()
+                        })
                 
-                code_text = code_elem.get_text()
-                if code_text.strip():
-                    code_blocks.append({
-                        'language': language,
-                        'code': code_text.strip()
-                    })
-            
-            return code_blocks
+                else:
+                    if is_soup:
+                        text = node.get_text().strip()
+                    elif is_lxml:
+                        text = node.text_content().strip()
+                    else:
+                        text = node.text().strip()
+                    if text:
+                        structure['headers'].append((int(tag[1]), text))
         except Exception as e:
-            logger.error(f"Error extracting code blocks: {e}")
-            return []
+            logger.error(f"Error extracting page structure: {e}")
+        
+        return structure
     
-    def extract_tables(self, html: str) -> List[Dict]:
-        """Extract tables from HTML"""
+    def _main_slice(self, html: bytes) -> bytes:
+        """Cut a page down to its <main> element, keeping any declared charset"""
+        match = _MAIN_RE.search(html)
+        if not match:
+            return html
+        declared = EncodingDetector.find_declared_encoding(html, is_html=True)
+        prefix = b''
+        if declared:
+            try:
+                prefix = f'<meta charset="{codecs.lookup(declared).name}">'.encode('ascii')
+            except (LookupError, UnicodeEncodeError):
+                pass  # Unknown or mangled label; parse the slice as UTF-8
+        return prefix + match.group(0)
+    
+    def extract_all(self, html: PageTree, selector: Optional[str] = 'main') -> Dict:
+        """Extract text, headers, code blocks and tables from one parsed tree
+        
+        Raw bytes are cut down to the <main> element first when that is the
+        selector, so nav, sidebars and footer never reach the parser. A
+        <main> of STREAM_EXTRACT_MIN_BYTES or more is pull-parsed instead
+        of being built into a tree (needs lxml).
+        """
+        if selector == 'main' and isinstance(html, bytes):
+            html = self._main_slice(html)
+            if etree is not None and len(html) >= STREAM_EXTRACT_MIN_BYTES:
+                extracted = self._stream_extract(html)
+                if extracted is not None:
+                    return extracted
+        tree = self._parse(html)
+        extracted = self._extract_structure(tree)
+        extracted['text'] = self.extract_text(tree, selector=selector)
+        return extracted
+    
+    def _stream_extract(self, html: bytes) -> Optional[Dict]:
+        """extract_all for large pages, without holding the parsed tree
+        
+        Returns None if lxml cannot parse the page, so the caller can fall
+        back to the regular parsers.
+        """
+        declared = EncodingDetector.find_declared_encoding(html, is_html=True)
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            tables = []
-            
-            for table in soup.find_all('table'):
-                rows = []
-                for tr in table.find_all('tr'):
-                    cells = []
-                    for td in tr.find_all(['td', 'th']):
-                        cells.append(td.get_text().strip())
-                    if cells:
-                        rows.append(cells)
-                
-                if rows:
-                    tables.append({
-                        'headers': rows[0] if rows else [],
-                        'rows': rows[1:] if len(rows) > 1 else []
-                    })
-            
-            return tables
-        except Exception as e:
-            logger.error(f"Error extracting tables: {e}")
-            return []
+            parser = etree.HTMLPullParser(events=('start', 'end'), encoding=declared or 'utf-8')
+            extractor = _PullExtractor()
+            for offset in range(0, len(html), FETCH_CHUNK_SIZE):
+                parser.feed(html[offset:offset + FETCH_CHUNK_SIZE])
+                extractor.feed(parser.read_events())
+            parser.close()
+            extractor.feed(parser.read_events())
+        except (etree.LxmlError, ValueError, LookupError) as e:
+            logger.warning(f"Streaming parse failed ({e}), building the full tree")
+            return None
+        return extractor.result()
+    
+    def extract_headers(self, html: PageTree) -> List[Tuple[int, str]]:
+        """Extract header hierarchy from HTML"""
+        return self._extract_structure(html)['headers']
+    
+    def extract_code_blocks(self, html: PageTree) -> List[Dict[str, str]]:
+        """Extract code blocks from HTML with improved language detection"""
+        return self._extract_structure(html)['code_blocks']
+    
+    def extract_tables(self, html: PageTree) -> List[Dict]:
+        """Extract tables from HTML"""
+        return self._extract_structure(html)['tables']
     
     def validate_content(self, content: str) -> bool:
         """Check if scraped content is meaningful"""
@@ -258,11 +1004,62 @@ class BaseScraper:
             logger.warning(f"Content validation failed: only {len(content)} characters")
         return is_valid
     
+    def _write_file(self, filepath: Path, payload: bytes):
+        """Atomically replace a file's contents, skipping the write if unchanged
+        
+        The bytes go to a hidden temp file that is fsynced and renamed over
+        the target, so a crash never leaves a half-written file and identical
+        output causes no writes at all (less wear on SD cards).
+        """
+        with _get_profile().timed('write'):
+            try:
+                if os.path.getsize(filepath) == len(payload) and filepath.read_bytes() == payload:
+                    return
+            except OSError:
+                pass  # No previous file
+            
+            # Unique per writer, so threads saving the same file do not collide
+            tmp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                try:
+                    view = memoryview(payload)
+                    while view:
+                        view = view[os.write(fd, view):]
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, filepath)
+            except Exception:
+                # e.g. ENOSPC; don't leave a hidden temp file behind
+                tmp_path.unlink(missing_ok=True)
+                raise
+    
+    def _dump_json(self, data: Dict) -> bytes:
+        """Serialize data as JSON, using orjson when available
+        
+        The JSON files are for programs (the markdown is the human-readable
+        copy), so they are written compact unless verbose mode asks for indent.
+        """
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if self.config.verbose else None)
+        if self.config.verbose:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    
+    @staticmethod
+    def _load_json(raw: bytes):
+        """Parse JSON bytes, using orjson when available"""
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    
     def save_markdown(self, filename: str, content: str) -> Optional[Path]:
         """Save content as markdown file with error handling"""
         try:
+            self.config.ensure_dirs()
             filepath = self.config.output_dir / filename
-            filepath.write_text(content, encoding='utf-8')
+            self._write_file(filepath, content.encode('utf-8'))
             logger.info(f"Saved markdown: {filepath.name}")
             return filepath
         except IOError as e:
@@ -272,17 +1069,108 @@ class BaseScraper:
     def save_json(self, filename: str, data: Dict) -> Optional[Path]:
         """Save data as JSON file with error handling"""
         try:
+            self.config.ensure_dirs()
             filepath = self.config.output_dir / filename
-            filepath.write_text(json.dumps(data, indent=2), encoding='utf-8')
+            self._write_file(filepath, self._dump_json(data))
             logger.info(f"Saved JSON: {filepath.name}")
             return filepath
         except IOError as e:
             logger.error(f"Failed to save {filename}: {e}")
             return None
     
+    def save_outputs(self, md_filename: str, md_content: str,
+                     json_filename: str, data: Dict) -> Tuple[Optional[Path], Optional[Path]]:
+        """Save the markdown and JSON outputs of one scrape"""
+        return self.save_markdown(md_filename, md_content), self.save_json(json_filename, data)
+    
+    def _scrape(self, url: str, provider: str, model: Optional[str] = None,
+                title: Optional[str] = None, markdown: bool = False) -> Optional[Dict]:
+        """Fetch, extract, validate and save one documentation page
+        
+        With a model the page is saved as <provider>_<model>_context.md and
+        _data.json; without one it is the provider's models list and only
+        <provider>_models_context.md is written. A markdown page (llms.txt)
+        is used as-is instead of going through the HTML parser.
+        """
+        title = title or provider
+        logger.info(f"Scraping {title}...")
+        
+        fetched = self.fetch_url(url)
+        if not fetched:
+            return None
+        html, content_hash = fetched
+        
+        if model:
+            md_filename = f"{provider}_{model}_context.md"
+            json_filename = f"{provider}_{model}_data.json"
+        else:
+            md_filename = f"{provider}_models_context.md"
+            json_filename = None
+        output_filenames = [md_filename, json_filename] if json_filename else [md_filename]
+        unchanged = self._load_unchanged(url, output_filenames, content_hash)
+        if unchanged:
+            return unchanged
+        
+        if markdown:
+            content = html.decode('utf-8', errors='replace').strip()
+            if content.startswith('<'):
+                logger.info(f"{url} is not a markdown document")
+                return None
+            extracted = {'code_blocks': [], 'tables': []}
+        else:
+            with _get_profile().timed('parse'):
+                extracted = self.extract_all(html)
+            content = extracted['text']
+        
+        if not self.validate_content(content):
+            logger.warning(f"{title} content validation failed")
+            if self.config.verbose:
+                logger.info(f"HTML content (first 500 chars): {html[:500].decode('utf-8', errors='replace')}")
+            return None
+        
+        if model:
+            data = {
+                'provider': provider,
+                'model': model,
+                'source_url': url,
+                'scraped_at': datetime.now().isoformat(),
+                'content': content,
+                'code_examples': extracted['code_blocks'],
+                'tables': extracted['tables'],
+                'content_hash': content_hash
+            }
+            md_path, json_path = self.save_outputs(
+                md_filename, self.format_markdown(data, title),
+                json_filename, data
+            )
+            saved = md_path and json_path
+        else:
+            data = {
+                'provider': provider,
+                'content': content,
+                'code_examples': extracted['code_blocks'],
+                'source_url': url,
+                'scraped_at': datetime.now().isoformat()
+            }
+            saved = self.save_markdown(md_filename, self.format_markdown(data, title))
+        
+        if not saved:
+            logger.error(f"Failed to save files for {title}")
+            return None
+        self._save_parsed(url, content_hash, data)
+        logger.info(f"Successfully scraped {title}")
+        return data
+    
+    def scrape_llms_txt(self) -> Optional[Dict]:
+        """Save the provider's llms.txt as its models context, if it has one"""
+        url = LLMS_TXT_URLS.get(getattr(self, 'provider', None))
+        if not url:
+            return None
+        return self._scrape(url, self.provider, title=f"{self.provider} llms.txt", markdown=True)
+    
     def format_markdown(self, data: Dict, title: str) -> str:
         """Generic markdown formatter (template method pattern)"""
-        md = f"""# {title}
+        parts = [f"""# {title}
 
 **Source**: [{data['source_url']}]({data['source_url']})
 **Scraped**: {data['scraped_at']}
@@ -293,28 +1181,29 @@ class BaseScraper:
 
 ## Code Examples
 
-"""
+"""]
+        # Accumulate and join once; repeated += copies the whole document
         for i, block in enumerate(data['code_examples'], 1):
-            md += f"\n### Example {i} ({block['language']})\n\n```{block['language']}\n{block['code']}\n```\n"
+            lang = block['language']
+            parts.extend([f"\n### Example {i} ({lang})\n\n```{lang}\n", block['code'], "\n```\n"])
         
         if data.get('tables'):
-            md += "\n## Tables\n"
+            parts.append("\n## Tables\n")
             for i, table in enumerate(data['tables'], 1):
-                md += f"\n### Table {i}\n\n"
+                parts.append(f"\n### Table {i}\n\n")
                 if table['headers']:
-                    md += "| " + " | ".join(table['headers']) + " |\n"
-                    md += "|" + "|".join(["---"] * len(table['headers'])) + "|\n"
-                for row in table['rows']:
-                    md += "| " + " | ".join(row) + " |\n"
+                    parts.append("| " + " | ".join(table['headers']) + " |\n")
+                    parts.append("|" + "|".join(["---"] * len(table['headers'])) + "|\n")
+                parts.extend("| " + " | ".join(row) + " |\n" for row in table['rows'])
         
-        return md
+        return ''.join(parts)
 
 
 class AIMLAPIScraper(BaseScraper):
     """Scraper for AIML API documentation"""
     
-    def __init__(self, config: ScraperConfig = None):
-        super().__init__(config)
+    def __init__(self, config: ScraperConfig = None, session: 'requests.Session' = None):
+        super().__init__(config, session)
         self.base_url = "https://docs.aimlapi.com"
         self.provider = "aimlapi"
     
@@ -324,143 +1213,52 @@ class AIMLAPIScraper(BaseScraper):
     
     def scrape_model(self, provider: str, model: str) -> Optional[Dict]:
         """Scrape a specific model documentation"""
-        logger.info(f"Scraping {provider}/{model} from AIML API...")
-        
-        url = self.get_model_url(provider, model)
-        html = self.fetch_url(url)
-        
-        if not html:
-            return None
-        
-        # Extract content (try to target main content area)
-        content = self.extract_text(html, selector='main')
-        
-        # Validate content
-        if not self.validate_content(content):
-            if self.config.verbose:
-                logger.info(f"HTML content (first 500 chars): {html[:500]}")
-            return None
-        
-        code_blocks = self.extract_code_blocks(html)
-        tables = self.extract_tables(html)
-        
-        data = {
-            'provider': provider,
-            'model': model,
-            'source_url': url,
-            'scraped_at': datetime.now().isoformat(),
-            'content': content,
-            'code_examples': code_blocks,
-            'tables': tables,
-            'content_hash': hashlib.sha256(content.encode()).hexdigest()
-        }
-        
-        # Save files
-        md_filename = f"{provider}_{model}_context.md"
-        json_filename = f"{provider}_{model}_data.json"
-        
-        md_path = self.save_markdown(md_filename, self.format_markdown(data, f"{provider.upper()} - {model}"))
-        json_path = self.save_json(json_filename, data)
-        
-        if md_path and json_path:
-            logger.info(f"Successfully scraped {provider}/{model}")
-            return data
-        else:
-            logger.error(f"Failed to save files for {provider}/{model}")
-            return None
+        return self._scrape(self.get_model_url(provider, model), provider, model,
+                            f"{provider.upper()} - {model}")
 
 
 class OpenAIScraper(BaseScraper):
     """Scraper for OpenAI documentation"""
     
-    def __init__(self, config: ScraperConfig = None):
-        super().__init__(config)
+    def __init__(self, config: ScraperConfig = None, session: 'requests.Session' = None):
+        super().__init__(config, session)
         self.base_url = "https://platform.openai.com/docs/api-reference"
         self.provider = "openai"
     
+    def get_models_url(self) -> str:
+        """Build models list documentation URL"""
+        return f"{self.base_url}/models"
+    
     def scrape_models(self) -> List[Dict]:
         """Scrape OpenAI models list"""
-        logger.info("Scraping OpenAI models...")
-        
-        url = f"{self.base_url}/models"
-        html = self.fetch_url(url)
-        
-        if not html:
-            return []
-        
-        content = self.extract_text(html, selector='main')
-        
-        if not self.validate_content(content):
-            logger.warning("OpenAI content validation failed")
-            return []
-        
-        code_blocks = self.extract_code_blocks(html)
-        
-        data = {
-            'provider': self.provider,
-            'content': content,
-            'code_examples': code_blocks,
-            'source_url': url,
-            'scraped_at': datetime.now().isoformat()
-        }
-        
-        md_path = self.save_markdown(f"{self.provider}_models_context.md", 
-                                     self.format_markdown(data, "OpenAI API Documentation"))
-        
-        if md_path:
-            logger.info("Successfully scraped OpenAI")
-            return [data]
-        return []
+        data = self._scrape(self.get_models_url(), self.provider, title="OpenAI API Documentation")
+        return [data] if data else []
 
 
 class AnthropicScraper(BaseScraper):
     """Scraper for Anthropic Claude documentation"""
     
-    def __init__(self, config: ScraperConfig = None):
-        super().__init__(config)
+    def __init__(self, config: ScraperConfig = None, session: 'requests.Session' = None):
+        super().__init__(config, session)
         self.base_url = "https://docs.anthropic.com"
         self.provider = "anthropic"
     
+    def get_models_url(self) -> str:
+        """Build models list documentation URL"""
+        return f"{self.base_url}/en/api/models"
+    
     def scrape_models(self) -> List[Dict]:
         """Scrape Anthropic models documentation"""
-        logger.info("Scraping Anthropic models...")
-        
-        url = f"{self.base_url}/en/api/models"
-        html = self.fetch_url(url)
-        
-        if not html:
-            return []
-        
-        content = self.extract_text(html, selector='main')
-        
-        if not self.validate_content(content):
-            logger.warning("Anthropic content validation failed")
-            return []
-        
-        code_blocks = self.extract_code_blocks(html)
-        
-        data = {
-            'provider': self.provider,
-            'content': content,
-            'code_examples': code_blocks,
-            'source_url': url,
-            'scraped_at': datetime.now().isoformat()
-        }
-        
-        md_path = self.save_markdown(f"{self.provider}_models_context.md",
-                                     self.format_markdown(data, "Anthropic Claude API Documentation"))
-        
-        if md_path:
-            logger.info("Successfully scraped Anthropic")
-            return [data]
-        return []
+        data = self._scrape(self.get_models_url(), self.provider,
+                            title="Anthropic Claude API Documentation")
+        return [data] if data else []
 
 
 class GoogleGeminiScraper(BaseScraper):
     """Scraper for Google Gemini documentation"""
     
-    def __init__(self, config: ScraperConfig = None):
-        super().__init__(config)
+    def __init__(self, config: ScraperConfig = None, session: 'requests.Session' = None):
+        super().__init__(config, session)
         self.base_url = "https://ai.google.dev"
         self.provider = "google"
     
@@ -469,87 +1267,27 @@ class GoogleGeminiScraper(BaseScraper):
         # Convert model name to URL format (e.g., flash-2.5 -> gemini-2.5-flash)
         return f"{self.base_url}/models/gemini-{model}"
     
+    def get_models_url(self) -> str:
+        """Build models list documentation URL"""
+        return f"{self.base_url}/models"
+    
     def scrape_model(self, model: str) -> Optional[Dict]:
         """Scrape a specific model documentation"""
-        logger.info(f"Scraping Google Gemini {model}...")
-        
-        url = self.get_model_url(model)
-        html = self.fetch_url(url)
-        
-        if not html:
-            return None
-        
-        content = self.extract_text(html, selector='main')
-        
-        if not self.validate_content(content):
-            logger.warning(f"Google {model} content validation failed")
-            return None
-        
-        code_blocks = self.extract_code_blocks(html)
-        tables = self.extract_tables(html)
-        
-        data = {
-            'provider': self.provider,
-            'model': model,
-            'source_url': url,
-            'scraped_at': datetime.now().isoformat(),
-            'content': content,
-            'code_examples': code_blocks,
-            'tables': tables,
-            'content_hash': hashlib.sha256(content.encode()).hexdigest()
-        }
-        
-        md_filename = f"{self.provider}_{model}_context.md"
-        json_filename = f"{self.provider}_{model}_data.json"
-        
-        md_path = self.save_markdown(md_filename, self.format_markdown(data, f"Google Gemini - {model}"))
-        json_path = self.save_json(json_filename, data)
-        
-        if md_path and json_path:
-            logger.info(f"Successfully scraped Google Gemini {model}")
-            return data
-        return None
+        return self._scrape(self.get_model_url(model), self.provider, model,
+                            f"Google Gemini - {model}")
     
     def scrape_models(self) -> List[Dict]:
         """Scrape Google Gemini models list page"""
-        logger.info("Scraping Google Gemini models list...")
-        
-        url = f"{self.base_url}/models"
-        html = self.fetch_url(url)
-        
-        if not html:
-            return []
-        
-        content = self.extract_text(html, selector='main')
-        
-        if not self.validate_content(content):
-            logger.warning("Google models list validation failed")
-            return []
-        
-        code_blocks = self.extract_code_blocks(html)
-        
-        data = {
-            'provider': self.provider,
-            'content': content,
-            'code_examples': code_blocks,
-            'source_url': url,
-            'scraped_at': datetime.now().isoformat()
-        }
-        
-        md_path = self.save_markdown(f"{self.provider}_models_context.md",
-                                     self.format_markdown(data, "Google Gemini API Documentation"))
-        
-        if md_path:
-            logger.info("Successfully scraped Google Gemini models list")
-            return [data]
-        return []
+        data = self._scrape(self.get_models_url(), self.provider,
+                            title="Google Gemini API Documentation")
+        return [data] if data else []
 
 
 class DeepSeekScraper(BaseScraper):
     """Scraper for DeepSeek documentation"""
     
-    def __init__(self, config: ScraperConfig = None):
-        super().__init__(config)
+    def __init__(self, config: ScraperConfig = None, session: 'requests.Session' = None):
+        super().__init__(config, session)
         self.base_url = "https://platform.deepseek.com/docs"
         self.provider = "deepseek"
     
@@ -557,87 +1295,27 @@ class DeepSeekScraper(BaseScraper):
         """Build model documentation URL"""
         return f"{self.base_url}/models/{model}"
     
+    def get_models_url(self) -> str:
+        """Build models list documentation URL"""
+        return f"{self.base_url}/models"
+    
     def scrape_model(self, model: str) -> Optional[Dict]:
         """Scrape a specific model documentation"""
-        logger.info(f"Scraping DeepSeek {model}...")
-        
-        url = self.get_model_url(model)
-        html = self.fetch_url(url)
-        
-        if not html:
-            return None
-        
-        content = self.extract_text(html, selector='main')
-        
-        if not self.validate_content(content):
-            logger.warning(f"DeepSeek {model} content validation failed")
-            return None
-        
-        code_blocks = self.extract_code_blocks(html)
-        tables = self.extract_tables(html)
-        
-        data = {
-            'provider': self.provider,
-            'model': model,
-            'source_url': url,
-            'scraped_at': datetime.now().isoformat(),
-            'content': content,
-            'code_examples': code_blocks,
-            'tables': tables,
-            'content_hash': hashlib.sha256(content.encode()).hexdigest()
-        }
-        
-        md_filename = f"{self.provider}_{model}_context.md"
-        json_filename = f"{self.provider}_{model}_data.json"
-        
-        md_path = self.save_markdown(md_filename, self.format_markdown(data, f"DeepSeek - {model}"))
-        json_path = self.save_json(json_filename, data)
-        
-        if md_path and json_path:
-            logger.info(f"Successfully scraped DeepSeek {model}")
-            return data
-        return None
+        return self._scrape(self.get_model_url(model), self.provider, model,
+                            f"DeepSeek - {model}")
     
     def scrape_models(self) -> List[Dict]:
         """Scrape DeepSeek models list page"""
-        logger.info("Scraping DeepSeek models list...")
-        
-        url = f"{self.base_url}/models"
-        html = self.fetch_url(url)
-        
-        if not html:
-            return []
-        
-        content = self.extract_text(html, selector='main')
-        
-        if not self.validate_content(content):
-            logger.warning("DeepSeek models list validation failed")
-            return []
-        
-        code_blocks = self.extract_code_blocks(html)
-        
-        data = {
-            'provider': self.provider,
-            'content': content,
-            'code_examples': code_blocks,
-            'source_url': url,
-            'scraped_at': datetime.now().isoformat()
-        }
-        
-        md_path = self.save_markdown(f"{self.provider}_models_context.md",
-                                     self.format_markdown(data, "DeepSeek API Documentation"))
-        
-        if md_path:
-            logger.info("Successfully scraped DeepSeek models list")
-            return [data]
-        return []
+        data = self._scrape(self.get_models_url(), self.provider,
+                            title="DeepSeek API Documentation")
+        return [data] if data else []
 
 
 class MistralScraper(BaseScraper):
     """Scraper for Mistral documentation"""
     
-    def __init__(self, config: ScraperConfig = None):
-        super().__init__(config)
+    def __init__(self, config: ScraperConfig = None, session: 'requests.Session' = None):
+        super().__init__(config, session)
         self.base_url = "https://docs.mistral.ai"
         self.provider = "mistral"
     
@@ -645,140 +1323,244 @@ class MistralScraper(BaseScraper):
         """Build model documentation URL"""
         return f"{self.base_url}/capabilities/models/{model}"
     
+    def get_models_url(self) -> str:
+        """Build models list documentation URL"""
+        return f"{self.base_url}/capabilities/models"
+    
     def scrape_model(self, model: str) -> Optional[Dict]:
         """Scrape a specific model documentation"""
-        logger.info(f"Scraping Mistral {model}...")
-        
-        url = self.get_model_url(model)
-        html = self.fetch_url(url)
-        
-        if not html:
-            return None
-        
-        content = self.extract_text(html, selector='main')
-        
-        if not self.validate_content(content):
-            logger.warning(f"Mistral {model} content validation failed")
-            return None
-        
-        code_blocks = self.extract_code_blocks(html)
-        tables = self.extract_tables(html)
-        
-        data = {
-            'provider': self.provider,
-            'model': model,
-            'source_url': url,
-            'scraped_at': datetime.now().isoformat(),
-            'content': content,
-            'code_examples': code_blocks,
-            'tables': tables,
-            'content_hash': hashlib.sha256(content.encode()).hexdigest()
-        }
-        
-        md_filename = f"{self.provider}_{model}_context.md"
-        json_filename = f"{self.provider}_{model}_data.json"
-        
-        md_path = self.save_markdown(md_filename, self.format_markdown(data, f"Mistral - {model}"))
-        json_path = self.save_json(json_filename, data)
-        
-        if md_path and json_path:
-            logger.info(f"Successfully scraped Mistral {model}")
-            return data
-        return None
+        return self._scrape(self.get_model_url(model), self.provider, model,
+                            f"Mistral - {model}")
     
     def scrape_models(self) -> List[Dict]:
         """Scrape Mistral models list page"""
-        logger.info("Scraping Mistral models list...")
-        
-        url = f"{self.base_url}/capabilities/models"
-        html = self.fetch_url(url)
-        
-        if not html:
-            return []
-        
-        content = self.extract_text(html, selector='main')
-        
-        if not self.validate_content(content):
-            logger.warning("Mistral models list validation failed")
-            return []
-        
-        code_blocks = self.extract_code_blocks(html)
-        
-        data = {
-            'provider': self.provider,
-            'content': content,
-            'code_examples': code_blocks,
-            'source_url': url,
-            'scraped_at': datetime.now().isoformat()
-        }
-        
-        md_path = self.save_markdown(f"{self.provider}_models_context.md",
-                                     self.format_markdown(data, "Mistral API Documentation"))
-        
-        if md_path:
-            logger.info("Successfully scraped Mistral models list")
-            return [data]
-        return []
+        data = self._scrape(self.get_models_url(), self.provider,
+                            title="Mistral API Documentation")
+        return [data] if data else []
 
 
 class CohereScraper(BaseScraper):
     """Scraper for Cohere documentation"""
     
-    def __init__(self, config: ScraperConfig = None):
-        super().__init__(config)
+    def __init__(self, config: ScraperConfig = None, session: 'requests.Session' = None):
+        super().__init__(config, session)
         self.base_url = "https://docs.cohere.com"
         self.provider = "cohere"
     
+    def get_models_url(self) -> str:
+        """Build models list documentation URL"""
+        return f"{self.base_url}/models"
+    
     def scrape_models(self) -> List[Dict]:
         """Scrape Cohere models documentation"""
-        logger.info("Scraping Cohere models...")
-        
-        url = f"{self.base_url}/models"
-        html = self.fetch_url(url)
-        
-        if not html:
-            return []
-        
-        content = self.extract_text(html, selector='main')
-        
-        if not self.validate_content(content):
-            logger.warning("Cohere content validation failed")
-            return []
-        
-        code_blocks = self.extract_code_blocks(html)
-        
-        data = {
-            'provider': self.provider,
-            'content': content,
-            'code_examples': code_blocks,
-            'source_url': url,
-            'scraped_at': datetime.now().isoformat()
-        }
-        
-        md_path = self.save_markdown(f"{self.provider}_models_context.md",
-                                     self.format_markdown(data, "Cohere API Documentation"))
+        data = self._scrape(self.get_models_url(), self.provider, title="Cohere API Documentation")
+        return [data] if data else []
+
+
+class AsyncBaseScraper:
+    """Async (aiohttp) fetch layer used by ScraperOrchestrator.scrape_all_async"""
+    
+    def __init__(self, config: ScraperConfig, limit: int = 64, limit_per_host: int = 4):
+        _load_scraping_libs()
+        self.config = config
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.session = None
+        self._semaphore = asyncio.Semaphore(limit)
+        self._host_locks = {}
+        self._next_request_at = {}  # host -> earliest loop time for next request
+        self._fetches = {}  # url -> in-flight task, so concurrent requests share one download
+    
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=300,
+            ssl=None if self.config.verify_ssl else False
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": self.config.user_agent},
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+        )
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+    
+    async def _throttle(self, url: str, interval: float):
+        """Space requests to the same host by interval seconds"""
+        host = urlparse(url).netloc
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        loop = asyncio.get_running_loop()
+        async with lock:
+            wait = self._next_request_at.get(host, 0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                _get_profile().add_time('sleep', wait)
+            self._next_request_at[host] = loop.time() + interval
+    
+    async def _get(self, url: str, headers: Dict[str, str]) -> Tuple[int, dict, bytes, str]:
+        """GET url, returning (status, headers, body, sha256 of body)"""
+        async with self.session.get(url, headers=headers) as response:
+            if response.status != 304:
+                response.raise_for_status()
+            hasher = hashlib.sha256()
+            chunks = []
+            async for chunk in response.content.iter_chunked(FETCH_CHUNK_SIZE):
+                hasher.update(chunk)
+                chunks.append(chunk)
+            return response.status, response.headers, b''.join(chunks), hasher.hexdigest()
+    
+    def _errors(self) -> tuple:
+        """Exceptions that count as a failed fetch attempt"""
+        return (aiohttp.ClientError, asyncio.TimeoutError)
+    
+    def _error_status(self, error: Exception) -> Optional[int]:
+        """HTTP status behind a failed attempt, if the server answered"""
+        return getattr(error, 'status', None)
+    
+    async def fetch_url(self, scraper: BaseScraper, url: str) -> Optional[Tuple[bytes, str]]:
+        """Fetch URL with retries and conditional GETs, once per fetcher
+        
+        Callers asking for a URL that is already being fetched await the
+        same download.
+        """
+        task = self._fetches.get(url)
+        if task is None:
+            task = self._fetches[url] = asyncio.ensure_future(self._fetch(scraper, url))
+            # Forget it once done, so a long batch does not keep every body alive
+            task.add_done_callback(lambda _: self._fetches.pop(url, None))
+        else:
+            logger.debug(f"Already fetching {url}, sharing the download")
+        return await task
+    
+    async def _fetch(self, scraper: BaseScraper, url: str) -> Optional[Tuple[bytes, str]]:
+        """Fetch URL with retries and conditional GETs, using scraper's cache"""
+        cached = scraper._load_http_cache(url)
+        headers = scraper._conditional_headers(cached)
+        profile = _get_profile()
+        errors = []
         
-        if md_path:
-            logger.info("Successfully scraped Cohere")
-            return [data]
-        return []
+        for attempt in range(self.config.max_retries):
+            try:
+                await self._throttle(url, scraper._rate_limit_interval())
+                async with self._semaphore:
+                    logger.info(f"Fetching {url} (attempt {attempt + 1}/{self.config.max_retries})")
+                    with profile.timed('fetch'):
+                        status, response_headers, body, content_hash = await self._get(url, headers)
+                profile.record_fetch(url, attempt + 1)
+                profile.record_errors(url, errors)
+                
+                if status == 304 and cached:
+                    logger.info(f"Not modified, using cached copy of {url}")
+                    scraper.unchanged_urls.add(url)
+                    return cached['body'], cached['content_hash']
+                
+                logger.info(f"Successfully fetched {url}")
+                scraper.unchanged_urls.discard(url)
+                scraper._save_http_cache(url, response_headers, body, content_hash)
+                return body, content_hash
+            except self._errors() as e:
+                errors.append(type(e).__name__)
+                status = self._error_status(e)
+                if status and 400 <= status < 500 and status != 429:
+                    # Client errors such as 404 will not succeed on a retry
+                    logger.error(f"Failed to fetch {url}: {e}")
+                elif attempt < self.config.max_retries - 1:
+                    logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                    await asyncio.sleep(self.config.retry_delay)
+                    profile.add_time('sleep', self.config.retry_delay)
+                    continue
+                else:
+                    logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                    logger.error(f"Failed to fetch {url} after {self.config.max_retries} attempts")
+                profile.record_fetch(url, attempt + 1)
+                profile.record_errors(url, errors)
+                return None
+
+
+class AsyncHTTP2Scraper(AsyncBaseScraper):
+    """Async (httpx) fetch layer that multiplexes each host's requests over HTTP/2
+    
+    Docs sites serve every page from one origin, so a single HTTP/2 connection
+    carries all of a provider's concurrent GETs instead of limit_per_host
+    HTTP/1.1 sockets. Used by scrape_all_async when httpx[http2] is installed.
+    """
+    
+    async def __aenter__(self):
+        self.session = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=self.limit,
+                                max_keepalive_connections=self.limit_per_host * 5),
+            headers={"User-Agent": self.config.user_agent},
+            timeout=self.config.timeout,
+            verify=self.config.verify_ssl,
+            follow_redirects=True
+        )
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.session.aclose()
+    
+    async def _get(self, url: str, headers: Dict[str, str]) -> Tuple[int, dict, bytes, str]:
+        """GET url, returning (status, headers, body, sha256 of body)"""
+        async with self.session.stream('GET', url, headers=headers) as response:
+            if response.status_code != 304:
+                response.raise_for_status()
+            hasher = hashlib.sha256()
+            chunks = []
+            async for chunk in response.aiter_bytes(FETCH_CHUNK_SIZE):
+                hasher.update(chunk)
+                chunks.append(chunk)
+            return response.status_code, response.headers, b''.join(chunks), hasher.hexdigest()
+    
+    def _errors(self) -> tuple:
+        """Exceptions that count as a failed fetch attempt"""
+        return (httpx.HTTPError,)
+    
+    def _error_status(self, error: Exception) -> Optional[int]:
+        """HTTP status behind a failed attempt, if the server answered"""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code
+        return None
 
 
 class ScraperOrchestrator:
     """Orchestrate scraping across multiple providers"""
     
     def __init__(self, config: ScraperConfig = None):
-        self.config = config or ScraperConfig()
-        self.scrapers = {
-            'aimlapi': AIMLAPIScraper(config),
-            'openai': OpenAIScraper(config),
-            'anthropic': AnthropicScraper(config),
-            'google': GoogleGeminiScraper(config),
-            'deepseek': DeepSeekScraper(config),
-            'mistral': MistralScraper(config),
-            'cohere': CohereScraper(config),
+        self.config = config or _get_default_config()
+        self.no_llms_txt = set()  # Providers whose llms.txt turned out to be unusable
+    
+    # session and scrapers are built on first use, so `list` never imports requests
+    @functools.cached_property
+    def session(self) -> 'requests.Session':
+        """One pooled session so every scraper reuses kept-alive connections"""
+        return create_session(self.config)
+    
+    @functools.cached_property
+    def scrapers(self) -> Dict[str, BaseScraper]:
+        """Scraper per provider name, all sharing self.session"""
+        return {
+            'aimlapi': AIMLAPIScraper(self.config, self.session),
+            'openai': OpenAIScraper(self.config, self.session),
+            'anthropic': AnthropicScraper(self.config, self.session),
+            'google': GoogleGeminiScraper(self.config, self.session),
+            'deepseek': DeepSeekScraper(self.config, self.session),
+            'mistral': MistralScraper(self.config, self.session),
+            'cohere': CohereScraper(self.config, self.session),
         }
     
+    def clear_cache(self):
+        """Drop cached HTTP responses and parsed pages so everything is re-fetched"""
+        if requests_cache is not None and isinstance(self.session, requests_cache.CachedSession):
+            self.session.cache.clear()
+        for pattern in ('*.json', '*.html', 'parsed/*.json'):
+            for path in self.config.cache_dir.glob(pattern):
+                path.unlink()
+        logger.info("Cache cleared")
+    
     def scrape_aimlapi_model(self, provider: str, model: str) -> Optional[Dict]:
         """Scrape a specific model from AIML API"""
         scraper = self.scrapers['aimlapi']
@@ -804,12 +1586,132 @@ class ScraperOrchestrator:
             return []
         
         scraper = self.scrapers[provider]
+        if self._use_llms_txt(provider):
+            data = scraper.scrape_llms_txt()
+            if data:
+                return [data]
+            logger.info(f"No usable llms.txt for {provider}, scraping HTML instead")
+            self.no_llms_txt.add(provider)
+        
         if hasattr(scraper, 'scrape_models'):
             return scraper.scrape_models()
         else:
             logger.warning(f"Provider {provider} requires specific model names")
             return []
     
+    def _use_llms_txt(self, provider: str) -> bool:
+        """Whether a provider's models list should come from its llms.txt"""
+        return (self.config.prefer_llms_txt and provider in LLMS_TXT_URLS
+                and provider not in self.no_llms_txt)
+    
+    def scrape_tasks(self, tasks: List[Tuple[str, Optional[str]]],
+                     max_workers: Optional[int] = None) -> List:
+        """Run (provider, model) scrape tasks on a bounded thread pool
+        
+        Results come back in task order. Requests to the same host stay spaced
+        by the provider rate limit, so extra workers add concurrency across hosts.
+        max_workers defaults to config.workers.
+        """
+        max_workers = max_workers or self.config.workers
+        if len(tasks) <= 1 or max_workers <= 1:
+            return [self._run_task(provider, model) for provider, model in tasks]
+        
+        results = [None] * len(tasks)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+            future_to_index = {
+                executor.submit(self._run_task, provider, model): index
+                for index, (provider, model) in enumerate(tasks)
+            }
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    provider, model = tasks[index]
+                    logger.error(f"Scraping {provider} {model or ''} failed: {e}")
+        
+        return results
+    
+    def scrape_all(self, providers: List[str]) -> Dict[str, List[Dict]]:
+        """Scrape the models lists of several providers in parallel threads"""
+        providers = list(dict.fromkeys(providers))
+        results = self.scrape_tasks([(provider, None) for provider in providers],
+                                    max_workers=len(self.scrapers))
+        return {provider: result or [] for provider, result in zip(providers, results)}
+    
+    def _task_url(self, provider: str, model: Optional[str]) -> Optional[str]:
+        """URL a scrape task will fetch, or None if it can't be known up front"""
+        scraper = self.scrapers.get(provider)
+        if scraper is None:
+            return None
+        if provider == 'aimlapi':
+            source, _, name = (model or '').partition('/')
+            return scraper.get_model_url(source, name) if name else None
+        if model:
+            return scraper.get_model_url(model) if hasattr(scraper, 'get_model_url') else None
+        if self._use_llms_txt(provider):
+            return LLMS_TXT_URLS[provider]
+        return scraper.get_models_url() if hasattr(scraper, 'get_models_url') else None
+    
+    def _run_task(self, provider: str, model: Optional[str]):
+        """Run one scrape task synchronously"""
+        if provider == 'aimlapi':
+            source, _, name = (model or '').partition('/')
+            return self.scrape_aimlapi_model(source, name)
+        if model:
+            return self.scrape_model(provider, model)
+        return self.scrape_provider(provider)
+    
+    async def _scrape_task_async(self, fetcher: AsyncBaseScraper, provider: str,
+                                 model: Optional[str]):
+        """Fetch a task's page asynchronously, then parse/save it off the event loop"""
+        url = self._task_url(provider, model)
+        if url:
+            scraper = self.scrapers[provider]
+            fetched = await fetcher.fetch_url(scraper, url)
+            if fetched is None and url == LLMS_TXT_URLS.get(provider):
+                # No llms.txt after all; fetch the models page instead
+                self.no_llms_txt.add(provider)
+                url = self._task_url(provider, model)
+                fetched = await fetcher.fetch_url(scraper, url)
+            if fetched is None:
+                return None
+            scraper.prefetched[url] = fetched
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._run_task, provider, model)
+    
+    async def scrape_all_async(self, tasks: List[Tuple[str, Optional[str]]]) -> List:
+        """Scrape many (provider, model) pairs concurrently
+        
+        model may be None to scrape the provider's models list; for aimlapi
+        it is given as "<source>/<model>" (e.g. "openai/gpt-4o").
+        """
+        _load_scraping_libs()
+        if httpx is not None:
+            fetcher_class = AsyncHTTP2Scraper
+        elif aiohttp is not None:
+            fetcher_class = AsyncBaseScraper
+        else:
+            logger.warning("aiohttp not installed, scraping sequentially (pip install aiohttp or httpx[http2])")
+            return [self._run_task(provider, model) for provider, model in tasks]
+        
+        async with fetcher_class(self.config) as fetcher:
+            results = await asyncio.gather(
+                *(self._scrape_task_async(fetcher, provider, model) for provider, model in tasks),
+                return_exceptions=True
+            )
+
+        # A failed task is logged and leaves None, as in scrape_tasks
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                provider, model = tasks[index]
+                logger.error(f"Scraping {provider} {model or ''} failed: {result}")
+                results[index] = None
+        return results
+    
     def list_output_files(self) -> List[Path]:
         """List all scraped files (excluding cache and temp directories)"""
         all_files = sorted(self.config.output_dir.glob('*'))
@@ -847,54 +1749,7 @@ class ScraperOrchestrator:
         print("="*60 + "\n")
 
 
-def main():
-    """Main CLI interface"""
-    import argparse
-    
-    parser = argparse.ArgumentParser(
-        description="ModelDocs Scraper Toolkit v2 - Scrape AI model documentation"
-    )
-    
-    parser.add_argument(
-        'command',
-        choices=['scrape', 'list', 'help'],
-        help='Command to execute'
-    )
-    
-    parser.add_argument(
-        '--provider',
-        help='Provider name (aimlapi, openai, anthropic, google, deepseek, mistral, cohere)'
-    )
-    
-    parser.add_argument(
-        '--model',
-        help='Model name (for AIML API provider)'
-    )
-    
-    parser.add_argument(
-        '--source',
-        help='Source provider for AIML API (e.g., openai, anthropic)'
-    )
-    
-    parser.add_argument(
-        '--model',
-        help='Model name (for providers that support model-specific scraping)'
-    )
-    
-    parser.add_argument(
-        '--verbose',
-        action='store_true',
-        help='Show HTML content on empty scrapes (for debugging)'
-    )
-    
-    args = parser.parse_args()
-    
-    config = ScraperConfig()
-    config.verbose = args.verbose
-    orchestrator = ScraperOrchestrator(config)
-    
-    if args.command == 'help':
-        print("""
+HELP_TEXT = """
 ModelDocs Scraper Toolkit v2 - Usage Examples
 ==============================================
 
@@ -934,6 +1789,23 @@ ModelDocs Scraper Toolkit v2 - Usage Examples
 12. Scrape specific model from Mistral:
     python3 scraper_toolkit_v2.py scrape --provider mistral --model mistral-large
 
+13. Ignore cached pages and re-fetch everything:
+    python3 scraper_toolkit_v2.py scrape --provider openai --no-cache
+
+14. Scrape several providers or models in parallel:
+    python3 scraper_toolkit_v2.py scrape --provider all --workers 8
+    python3 scraper_toolkit_v2.py scrape --provider aimlapi --source openai --model gpt-4o,gpt-4o-mini
+
+15. Scrape a batch of pages listed in a file, one "provider[,model]" per line
+    (aimlapi lines use "aimlapi,<source>/<model>"; # starts a comment):
+    python3 scraper_toolkit_v2.py scrape --jobs jobs.txt
+
+16. Show where the time went (fetch/parse/write/sleep, retries, errors per host):
+    python3 scraper_toolkit_v2.py scrape --provider all --profile
+
+17. Save a provider's llms.txt link index instead of its models page:
+    python3 scraper_toolkit_v2.py scrape --provider anthropic --llms-txt
+
 Supported Providers:
   • aimlapi   - AIML API (requires --source and --model)
   • openai    - OpenAI API (supports --model for specific models)
@@ -945,44 +1817,206 @@ Supported Providers:
 
 Improvements in v2:
   ✅ Better error handling with try-except blocks
-  ✅ Rate limiting (1 second delay between requests)
+  ✅ Per-host rate limiting (SCRAPER_RATE_LIMIT_<PROVIDER> to override)
   ✅ Content validation (minimum 100 characters)
   ✅ Logging to file and console
   ✅ Improved HTML parsing with main selector
+  ✅ C-backed parsing: selectolax (pip install selectolax), else lxml,
+     with BeautifulSoup as the fallback
   ✅ Better language detection for code blocks
   ✅ Consolidated markdown formatting
   ✅ Mobile-optimized user agent
   ✅ Verbose mode for debugging
   ✅ Model-specific scraping for all providers
   ✅ Automatic SD Card saving
-        """)
-    
-    elif args.command == 'scrape':
-        if not args.provider:
-            logger.error("Error: --provider is required")
-            sys.exit(1)
-        
-        if args.provider == 'aimlapi':
-            if not args.source or not args.model:
-                logger.error("Error: AIML API requires --source and --model")
-                logger.error("   Example: --source openai --model gpt-4o")
-                sys.exit(1)
-            
+  ✅ Optional llms.txt link index for providers that publish one (--llms-txt)
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> 'argparse.ArgumentParser':
+    """Build the CLI argument parser once per process"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="ModelDocs Scraper Toolkit v2 - Scrape AI model documentation"
+    )
+    
+    parser.add_argument(
+        'command',
+        choices=list(COMMANDS),
+        help='Command to execute'
+    )
+    
+    parser.add_argument(
+        '--provider',
+        help='Provider name (aimlapi, openai, anthropic, google, deepseek, mistral, cohere); '
+             'comma-separate several or use "all"'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        metavar='FILE',
+        help='Scrape every "provider[,model]" line of FILE (aimlapi: "aimlapi,<source>/<model>")'
+    )
+    
+    parser.add_argument(
+        '--model',
+        help='Model name (aimlapi requires this; other providers use it for '
+             'model-specific scraping); comma-separate several'
+    )
+    
+    parser.add_argument(
+        '--source',
+        help='Source provider for AIML API (e.g., openai, anthropic)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Parallel workers when scraping several providers/models without aiohttp/httpx '
+             '(default 8, max 20)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Clear cached pages first and re-fetch everything'
+    )
+    
+    parser.add_argument(
+        '--llms-txt',
+        action='store_true',
+        help="Save the provider's llms.txt link index (openai, anthropic, mistral, cohere) "
+             'as its models context instead of scraping the models page'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='After scraping, print time spent fetching, parsing, writing and sleeping, '
+             'and fetch attempts/errors per host'
+    )
+    
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Show HTML content on empty scrapes (for debugging)'
+    )
+    
+    return parser
+
+
+def _split_names(value: Optional[str]) -> List[str]:
+    """Split a comma-separated CLI value, dropping blanks"""
+    return [name.strip() for name in (value or '').split(',') if name.strip()]
+
+
+def _read_jobs(path: str) -> List[Tuple[str, Optional[str]]]:
+    """Read scrape tasks from a jobs file, one "provider[,model]" per line
+    
+    Blank lines and # comments are skipped. Raises ValueError on a line
+    scrape_tasks could not run.
+    """
+    tasks = []
+    with open(path, encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            provider, _, model = (part.strip() for part in line.partition(','))
+            if not provider:
+                raise ValueError(f"{path}:{number}: missing provider")
+            if provider == 'aimlapi' and '/' not in model:
+                raise ValueError(f"{path}:{number}: aimlapi jobs need <source>/<model>")
+            tasks.append((provider, model or None))
+    return tasks
+
+
+def _cmd_help(orchestrator: ScraperOrchestrator, args):
+    """help: print usage examples"""
+    print(HELP_TEXT)
+
+
+def _cmd_scrape(orchestrator: ScraperOrchestrator, args):
+    """scrape: fetch, extract and save the requested providers/models"""
+    started = time.perf_counter()
+    _load_scraping_libs()
+    if args.no_cache:
+        orchestrator.clear_cache()
+    
+    if args.provider == 'all':
+        providers = [name for name in orchestrator.scrapers if name != 'aimlapi']
+    else:
+        providers = _split_names(args.provider)
+    models = _split_names(args.model)
+    
+    tasks = list(getattr(args, 'job_tasks', []))
+    if tasks:
+        logger.info(f"Loaded {len(tasks)} job(s) from {args.jobs}")
+    for provider in providers:
+        if provider == 'aimlapi':
             logger.info(f"Starting AIML API scraper...")
-            orchestrator.scrape_aimlapi_model(args.source, args.model)
-        elif args.model:
+            tasks.extend(('aimlapi', f"{args.source}/{model}") for model in models)
+        elif models:
             # If model specified, try model-specific scraping
-            logger.info(f"Starting {args.provider} scraper for model {args.model}...")
-            orchestrator.scrape_model(args.provider, args.model)
+            logger.info(f"Starting {provider} scraper for model(s) {', '.join(models)}...")
+            tasks.extend((provider, model) for model in models)
         else:
             # Otherwise scrape models list
-            logger.info(f"Starting {args.provider} scraper...")
-            orchestrator.scrape_provider(args.provider)
-        
-        orchestrator.print_summary()
+            logger.info(f"Starting {provider} scraper...")
+            tasks.append((provider, None))
+    
+    if (httpx is not None or aiohttp is not None) and len(tasks) > 1:
+        # Fetch every page concurrently on one event loop; parse in threads
+        asyncio.run(orchestrator.scrape_all_async(tasks))
+    else:
+        orchestrator.scrape_tasks(tasks)
+    orchestrator.print_summary()
+    
+    if args.profile:
+        print("⏱  PROFILE (stage times are summed over parallel workers)")
+        print(_get_profile().report(time.perf_counter() - started) + "\n")
+
+
+def _cmd_list(orchestrator: ScraperOrchestrator, args):
+    """list: show the files scraped so far"""
+    orchestrator.print_summary()
+
+
+# CLI commands, in the order argparse lists them
+COMMANDS = {
+    'scrape': _cmd_scrape,
+    'list': _cmd_list,
+    'help': _cmd_help,
+}
+
+
+def main():
+    """Main CLI interface"""
+    parser = _build_parser()
+    args = parser.parse_args()
+    
+    # Reject incomplete scrape commands before any setup work
+    if args.command == 'scrape':
+        if not args.provider and not args.jobs:
+            parser.error("scrape requires --provider or --jobs")
+        if args.jobs:
+            try:
+                args.job_tasks = _read_jobs(args.jobs)
+            except (OSError, ValueError) as e:
+                parser.error(f"--jobs: {e}")
+        if 'aimlapi' in _split_names(args.provider) and not (args.source and _split_names(args.model)):
+            parser.error("AIML API requires --source and --model (e.g. --source openai --model gpt-4o)")
+    
+    config = ScraperConfig()
+    config.verbose = args.verbose
+    config.prefer_llms_txt = args.llms_txt
+    config.workers = max(1, min(args.workers, 20))
+    orchestrator = ScraperOrchestrator(config)
     
-    elif args.command == 'list':
-        orchestrator.print_summary()
+    COMMANDS[args.command](orchestrator, args)
 
 
 if __name__ == '__main__':
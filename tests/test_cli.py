@@ -0,0 +1,12 @@
+import scraper_toolkit as toolkit
+
+
+def test_cli_parses():
+    parser = toolkit._build_parser()
+    args = parser.parse_args(['scrape', '--provider', 'openai'])
+    assert args.command == 'scrape'
+    assert args.provider == 'openai'
+
+    # Registering --model twice made argparse raise before any command ran
+    model_options = [action for action in parser._actions if '--model' in action.option_strings]
+    assert len(model_options) == 1
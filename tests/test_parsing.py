@@ -0,0 +1,38 @@
+import pytest
+
+import scraper_toolkit as toolkit
+
+toolkit._load_scraping_libs()
+
+PAGE = (
+    '<html><head><meta charset="windows-1252"><title>Café</title></head>'
+    '<body><nav>skip</nav><main><h1>Café naïve</h1>\n'
+    '<p>Déjà vu – “quoted” text</p></main></body></html>'
+).encode('windows-1252')
+
+
+@pytest.fixture(params=['selectolax', 'lxml', 'bs4', 'stream'])
+def scraper(request, monkeypatch):
+    """A scraper that parses with only the requested backend"""
+    if request.param == 'selectolax' and toolkit.LexborHTMLParser is None:
+        pytest.skip('selectolax not installed')
+    if request.param in ('lxml', 'stream') and toolkit.lxml_html is None:
+        pytest.skip('lxml not installed')
+    if request.param != 'selectolax':
+        monkeypatch.setattr(toolkit, 'LexborHTMLParser', None)
+    if request.param == 'bs4':
+        monkeypatch.setattr(toolkit, 'lxml_html', None)
+    if request.param == 'stream':
+        monkeypatch.setattr(toolkit, 'STREAM_EXTRACT_MIN_BYTES', 0)
+    return toolkit.BaseScraper(toolkit.ScraperConfig())
+
+
+def test_non_utf8_page_decodes_on_every_backend(scraper):
+    extracted = scraper.extract_all(PAGE)
+    assert extracted['text'] == 'Café naïve\nDéjà vu – “quoted” text'
+    assert extracted['headers'] == [(1, 'Café naïve')]
+
+
+def test_mangled_charset_label_does_not_raise(scraper):
+    page = b'<meta charset="\xc3\xbc"><main><p>Plain ASCII text</p></main>'
+    assert scraper.extract_all(page)['text'] == 'Plain ASCII text'